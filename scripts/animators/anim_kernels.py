@@ -0,0 +1,132 @@
+# animators/anim_kernels.py
+
+"""
+ファイル名: animators/anim_kernels.py
+
+責務:
+    - 毎フレームの数値計算カーネルを提供する。
+        - 変位テーブル1フレーム分の復号と全ノード座標の更新、移動行（dirty set）の判定
+        - 柱・梁の両端座標から中点・回転クォータニオン・Zスケールの一括計算
+    - numba が利用可能なら @njit 版（prange 並列）を、無ければ NumPy 版を使用する。
+    - bpy には一切触れない（RNA への書き込みは building_animator 側で行う）。
+"""
+import numpy as np
+from configs import EPS_AXIS, EPS_MOVE
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# fastmath のうち NaN/Inf を仮定しないフラグ（nnan/ninf）は除外する（orig_depth 未設定は NaN）
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def _update_positions_numpy(base, disp, scale, positions, last, moved, work):
+    """NumPy 版。work は (N, 3) float32 の作業バッファ。"""
+    np.multiply(disp, scale, out=work)
+    np.add(base, work, out=positions)
+    np.subtract(positions, last, out=work)
+    np.abs(work, out=work)
+    # last 未設定（NaN）の行も移動ありとして扱う
+    np.logical_not(work.max(axis=1) < EPS_MOVE, out=moved)
+    last[moved] = positions[moved]
+
+
+def _member_transforms_numpy(p1, p2, depth, mid, quat, scale, vec, vhat, length):
+    """NumPy 版。作業配列は引数のバッファへ out= で書き込み、毎回の確保を避ける。"""
+    np.subtract(p2, p1, out=vec)
+    np.add(p1, p2, out=mid)
+    mid *= 0.5
+    np.einsum("ij,ij->i", vec, vec, out=length)
+    np.sqrt(length, out=length)
+    # 長さ0の部材は上向き扱い（単位クォータニオンになる）
+    has_len = length > EPS_AXIS
+    vhat[:] = (0.0, 0.0, 1.0)
+    np.divide(vec, length[:, None], out=vhat, where=has_len[:, None])
+    # up=(0,0,1) を vhat へ回す最短回転: w=√((1+vz)/2), xyz=(up×vhat)/(2w)=(-vy, vx, 0)/(2w)
+    # 真下向き（w≈0）は X 軸まわり180°で代替し、分岐なしで一括計算する
+    quat[:, 0] = np.sqrt(np.clip((1.0 + vhat[:, 2]) * 0.5, 0.0, 1.0))
+    flip = quat[:, 0] < EPS_AXIS
+    inv_2w = 0.5 / np.where(flip, 1.0, quat[:, 0])
+    quat[:, 1] = np.where(flip, 1.0, -vhat[:, 1] * inv_2w)
+    quat[:, 2] = np.where(flip, 0.0, vhat[:, 0] * inv_2w)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale[:, 2] = np.where(np.isnan(depth), 1.0, length / depth)
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True, fastmath=_FASTMATH, parallel=True)
+    def _positions_kernel(base, disp, scale, positions, last, moved, eps):
+        for i in prange(base.shape[0]):
+            is_moved = False
+            for k in range(3):
+                p = base[i, k] + disp[i, k] * scale[k]
+                positions[i, k] = p
+                d = abs(p - last[i, k])
+                if not d < eps:
+                    is_moved = True
+            moved[i] = is_moved
+            if is_moved:
+                for k in range(3):
+                    last[i, k] = positions[i, k]
+
+    @njit(cache=True, fastmath=_FASTMATH, parallel=True)
+    def _member_kernel(p1, p2, depth, eps, mid, quat, scale, length):
+        for i in prange(p1.shape[0]):
+            vx = p2[i, 0] - p1[i, 0]
+            vy = p2[i, 1] - p1[i, 1]
+            vz = p2[i, 2] - p1[i, 2]
+            mid[i, 0] = (p1[i, 0] + p2[i, 0]) * 0.5
+            mid[i, 1] = (p1[i, 1] + p2[i, 1]) * 0.5
+            mid[i, 2] = (p1[i, 2] + p2[i, 2]) * 0.5
+            n = np.sqrt(vx * vx + vy * vy + vz * vz)
+            length[i] = n
+            if n > eps:
+                hx = vx / n
+                hy = vy / n
+                hz = vz / n
+            else:
+                hx = 0.0
+                hy = 0.0
+                hz = 1.0
+            w = np.sqrt(min(1.0, max(0.0, (1.0 + hz) * 0.5)))
+            if w < eps:
+                quat[i, 0] = 0.0
+                quat[i, 1] = 1.0
+                quat[i, 2] = 0.0
+            else:
+                inv_2w = 0.5 / w
+                quat[i, 0] = w
+                quat[i, 1] = -hy * inv_2w
+                quat[i, 2] = hx * inv_2w
+            quat[i, 3] = 0.0
+            d = depth[i]
+            scale[i, 2] = 1.0 if np.isnan(d) else n / d
+
+
+def update_positions(base, disp, scale, positions, last, moved, work) -> None:
+    """
+    positions = base + disp * scale（disp は int16 量子化値または float32）を計算し、
+    last（前回移動判定時の座標）との差が EPS_MOVE 以上の行を moved に立てて last を更新する。
+    work は NumPy 版の作業バッファ（(N, 3) float32）。
+    """
+    if HAVE_NUMBA:
+        _positions_kernel(base, disp, scale, positions, last, moved, EPS_MOVE)
+    else:
+        _update_positions_numpy(base, disp, scale, positions, last, moved, work)
+
+
+def member_transforms(p1, p2, depth, mid, quat, scale, vec, vhat, length) -> None:
+    """
+    部材両端座標 p1, p2（(M, 3)）から mid（中点）, quat（+Z→部材方向の w,x,y,z）,
+    scale[:, 2]（長さ / orig_depth、未設定 NaN は 1）を in-place で計算する。
+    vec, vhat は NumPy 版の作業バッファ、length には部材長が入る。
+    """
+    if HAVE_NUMBA:
+        _member_kernel(p1, p2, depth, EPS_AXIS, mid, quat, scale, length)
+    else:
+        _member_transforms_numpy(p1, p2, depth, mid, quat, scale, vec, vhat, length)
@@ -6,6 +6,7 @@
 責務:
     - 各フレームでノード球、構造部材、パネル、屋根、サンドバッグユニットのアニメーションを更新。
     - SandbagUnitオブジェクトに設定されたrep_node／other_nodeの座標をBone_Rep/Bone_Otherに反映。
+    - パネル・屋根のトポロジ（頂点・面・UV）は初期化時に一度だけ確定し、毎フレームは頂点座標のみ更新。
 
 TODO:
     - Bone名やEmpty運用時のボーン構成を外部設定化
@@ -14,163 +15,796 @@ TODO:
     - 単体テスト追加: 引数バリデーションと例外シナリオ検証
 """
 import bpy
-import bmesh
-from typing import List, Tuple, Dict, Any, Optional
-from mathutils import Vector, Quaternion
+import numpy as np
+from typing import Callable, List, Tuple, Dict, Any, Optional
+from mathutils import Vector
 from utils import setup_logging
-from configs import EPS_AXIS, UV_MAP_NAME
+from .anim_kernels import update_positions, member_transforms
+from configs import (
+    UV_MAP_NAME,
+    QUAD_UVS,
+    NODE_ANIM_COLLECTION_NAME,
+    SANDBAG_ANIM_COLLECTION_NAME,
+    MEMBER_ANIM_COLLECTION_NAME,
+    ANIM_DISP_QUANTIZE,
+    EPS_MOVE,
+)
 
 log = setup_logging("building_animator")
 
+# 座標・変位が無いノードの既定値（読み取り専用として共有する）
+ZERO = Vector((0.0, 0.0, 0.0))
 
-def on_frame_building(
-    scene: bpy.types.Scene,
-    panel_objs: List[bpy.types.Object],
-    roof_obj: Optional[bpy.types.Object],
-    roof_quads: List[Tuple[int, int, int, int]],
-    member_objs: List[Tuple[bpy.types.Object, int, int]],
-    node_objs: Dict[int, bpy.types.Object],
-    sandbag_objs: Dict[Any, bpy.types.Object],
-    anim_data: Dict[int, Dict[int, Vector]],
-    sandbag_anim_data: Dict[int, Dict[int, Vector]],
-    base_node_pos: Dict[int, Vector],
-    base_sandbag_pos: Dict[Any, Vector],
-    core: Optional[Any] = None,
-) -> None:
+
+class BuildingAnimCache:
     """
-    シーン更新ごとに呼び出され、各種オブジェクトの位置・形状をアニメーションデータに基づき更新する。
+    on_frame_building が毎フレーム参照するオブジェクト群と事前計算データを保持する。
 
-    Args:
-        scene: 現在のBlenderシーン
+    属性:
         panel_objs: パネルオブジェクトリスト
         roof_obj: 屋根オブジェクト
         roof_quads: 屋根面のノードIDタプルリスト
         member_objs: (オブジェクト, start_id, end_id) の柱／梁リスト
         node_objs: ノードID→球オブジェクトマップ
         sandbag_objs: サンドバッグEmpty/Armatureマップ
-        anim_data: ノードアニメーションオフセット
-        sandbag_anim_data: サンドバッグノードアニメーションオフセット
         base_node_pos: 初期ノード座標
         base_sandbag_pos: 初期サンドバッグ座標
-        core: 将来拡張用（未使用）
+        panel_list: panel_ids を持つ有効なパネルオブジェクトのリスト
+        panel_ids: panel_list の panel_ids を連結したノードID配列（int64, (4Q,)）
+        panel_rows: 全パネル面（四角形）の各頂点に対応する positions の行番号（int32, (Q, 4)）
+        panel_quad_start: panel_list[i] の面が panel_rows[start[i]:start[i+1]] に対応（(P+1,)）
+        panel_coords: 全パネル頂点の座標バッファ（float32, (Q, 4, 3)）
+        panel_delta: 移動量判定用の作業バッファ（panel_coords と同形状）
+        roof_nids: 屋根メッシュの頂点順に並べたノードID
+        roof_rows: roof_nids に対応する positions の行番号
+        roof_coords: 屋根頂点座標バッファ（float32, (頂点数, 3)）
+        row_of: ノードID→positions の行番号
+        base_positions: 全ノードの基準座標（float32, (N, 3)）
+        disp_table: フレーム×行の変位テーブル（(F, N, 3)、データ無しは0）
+            ANIM_DISP_QUANTIZE 有効時は int16 量子化値、無効時は float32
+        disp_scale: disp_table を実変位へ戻すフレーム・軸ごとの係数（float32, (F, 3)）
+        disp_scale_zero: 変位テーブル範囲外フレーム用の係数（float32, (3,)）
+        disp_zero: 変位テーブル範囲外フレーム用のゼロ変位（disp_table[0] と同形状・同型）
+        disp_row: 座標更新の作業バッファ（float32, (N, 3)）
+        row_moved: 現フレームで移動ありと判定した行のマスク（bool, (N,)）
+        positions: 現フレームの全ノード座標（float32, (N, 3)）
+        node_coll, node_rows, node_batch: ノード球の一括書き込み用コレクション・対応行番号・
+            コレクション内の並び順のオブジェクトリスト
+        last_frame: 前回反映したフレーム（未反映は None）
+        positions_last: 各行について最後に「移動あり」と判定した座標（float32, (N, 3)）
+        panel_last, roof_last, member_last_p1, member_last_p2:
+            前回書き込んだ座標（移動量 EPS_MOVE 未満なら更新を省略する判定用）
+        sandbag_units: rep/other ノードIDを持つサンドバッグの (オブジェクト, rep_id, other_id) リスト
+        sandbag_coll, sandbag_rows, sandbag_batch: 非Armatureサンドバッグの同上
+        arm_bones: Armature サンドバッグごとの (Armature, Bone_Rep, Bone_Rep の head_local,
+            Bone_Other, Bone_Other の head_local)。ボーンが無い場合は None
+        arm_rows: arm_bones の (rep, other) に対応する positions の行番号（int32, (K, 2)）
+        arm_coords: Armature サンドバッグの (rep, other) 座標バッファ（float32, (K, 2, 3)）
+        steps: 毎フレーム実行する更新処理（対象の無いものは含めない）
+        move_steps: いずれかのノードが動いたフレームのみ実行する更新処理（同上）
+        member_list: 柱／梁オブジェクトのリスト（member_objs と同順）
+        member_rows_a, member_rows_b: 部材両端に対応する positions の行番号（int32, (M,)）
+        member_p1, member_p2: 部材両端座標バッファ（float32, (M, 3)）
+        member_orig_depth: 部材の基準長（orig_depth 未設定は NaN）
+        member_scale: 部材スケールバッファ（X/Y は初期値固定、Z を毎フレーム更新）
+        member_quat: 部材回転クォータニオンバッファ（float32, (M, 4)、Z 成分は常に0）
+        member_coll, member_order, member_batch: 柱／梁の一括書き込み用コレクション・
+            並び順に対応する member_list の添字・並び順のオブジェクトリスト
+        member_locs, member_quats, member_scales: member_order 順に並べ替えた書き込みバッファ
+        member_vec, member_mid, member_vhat, member_len:
+            部材方向・中点・単位方向・長さの作業バッファ（毎フレームの配列確保を避ける）
+
+    毎フレーム多数の属性を参照するため __slots__ で固定し、インスタンス辞書を持たない。
+    anim_data / sandbag_anim_data（{nid: {frame: Vector}}）は変位テーブル構築後は保持しない。
     """
-    # ノード球位置更新
-    for nid, obj in node_objs.items():
-        if nid in base_node_pos:
-            obj.location = base_node_pos[nid] + anim_data.get(nid, {}).get(
-                scene.frame_current, Vector()
-            )
 
-    # サンドバッグユニットアニメーション更新
-    for obj in sandbag_objs.values():
-        rep_id = obj.get("rep_node_id")
-        other_id = obj.get("other_node_id")
-        if rep_id is None or other_id is None:
-            continue
-        base_rep = base_sandbag_pos.get(rep_id, Vector())
-        base_other = base_sandbag_pos.get(other_id, Vector())
-        disp_rep = sandbag_anim_data.get(rep_id, {}).get(scene.frame_current, Vector())
-        disp_other = sandbag_anim_data.get(other_id, {}).get(
-            scene.frame_current, Vector()
+    __slots__ = (
+        "_object_names",
+        "arm_coords",
+        "arm_bones",
+        "arm_rows",
+        "base_node_pos",
+        "base_positions",
+        "base_sandbag_pos",
+        "disp_row",
+        "disp_scale",
+        "disp_scale_zero",
+        "disp_table",
+        "disp_zero",
+        "last_frame",
+        "member_batch",
+        "member_coll",
+        "member_order",
+        "member_last_p1",
+        "member_last_p2",
+        "member_len",
+        "member_list",
+        "member_locs",
+        "member_mid",
+        "member_objs",
+        "member_orig_depth",
+        "member_p1",
+        "member_p2",
+        "member_quat",
+        "member_quats",
+        "member_rows_a",
+        "member_rows_b",
+        "member_scale",
+        "member_scales",
+        "member_vec",
+        "member_vhat",
+        "move_steps",
+        "node_batch",
+        "node_coll",
+        "node_rows",
+        "node_locs",
+        "node_objs",
+        "panel_coords",
+        "panel_delta",
+        "panel_ids",
+        "panel_last",
+        "panel_list",
+        "panel_objs",
+        "panel_quad_start",
+        "panel_rows",
+        "positions",
+        "positions_last",
+        "roof_coords",
+        "roof_last",
+        "roof_nids",
+        "roof_obj",
+        "roof_quads",
+        "roof_rows",
+        "row_moved",
+        "row_of",
+        "sandbag_batch",
+        "sandbag_coll",
+        "sandbag_rows",
+        "sandbag_locs",
+        "sandbag_objs",
+        "sandbag_units",
+        "steps",
+    )
+
+    def __init__(
+        self,
+        panel_objs: List[bpy.types.Object],
+        roof_obj: Optional[bpy.types.Object],
+        roof_quads: List[Tuple[int, int, int, int]],
+        member_objs: List[Tuple[bpy.types.Object, int, int]],
+        node_objs: Dict[int, bpy.types.Object],
+        sandbag_objs: Dict[Any, bpy.types.Object],
+        anim_data: Dict[int, Dict[int, Vector]],
+        sandbag_anim_data: Dict[int, Dict[int, Vector]],
+        base_node_pos: Dict[int, Vector],
+        base_sandbag_pos: Dict[Any, Vector],
+    ) -> None:
+        self.panel_objs = panel_objs
+        self.roof_obj = roof_obj
+        self.roof_quads = roof_quads
+        self.member_objs = member_objs
+        self.node_objs = node_objs
+        self.sandbag_objs = sandbag_objs
+        self.base_node_pos = base_node_pos
+        self.base_sandbag_pos = base_sandbag_pos
+        self.roof_nids: List[int] = []
+        self._read_panel_ids()
+        self._read_sandbag_ids()
+        self._init_panel_meshes()
+        self._init_roof_mesh()
+        self._init_positions(anim_data, sandbag_anim_data)
+        self._init_panels()
+        self._init_members()
+        self._init_location_batches()
+        self._init_armatures()
+        self._init_steps()
+        self._reset_dirty_state()
+        self._object_names = self._collect_object_names()
+
+    def _collect_object_names(self) -> Dict[str, Any]:
+        """
+        Undo等でPython参照が失効した際の再解決用に、各オブジェクト名を控えておく。
+        """
+        return {
+            "panels": [obj.name for obj in self.panel_objs],
+            "roof": self.roof_obj.name if self.roof_obj else None,
+            "members": [(obj.name, a, b) for obj, a, b in self.member_objs],
+            "nodes": {nid: obj.name for nid, obj in self.node_objs.items()},
+            "sandbags": {key: obj.name for key, obj in self.sandbag_objs.items()},
+        }
+
+    def refresh_objects(self) -> None:
+        """
+        控えておいたオブジェクト名から参照を再解決する。
+        毎フレームの名前検索は行わず、ReferenceError 発生時のみ呼び出す想定。
+        """
+        get = bpy.data.objects.get
+        names = self._object_names
+        self.panel_objs = [o for o in map(get, names["panels"]) if o is not None]
+        self.roof_obj = get(names["roof"]) if names["roof"] else None
+        self.member_objs = [
+            (get(name), a, b) for name, a, b in names["members"] if get(name)
+        ]
+        self.node_objs = {
+            nid: get(name) for nid, name in names["nodes"].items() if get(name)
+        }
+        self.sandbag_objs = {
+            key: get(name) for key, name in names["sandbags"].items() if get(name)
+        }
+        self._read_panel_ids()
+        self._read_sandbag_ids()
+        self._init_panels()
+        self._init_members()
+        self._init_location_batches()
+        self._init_armatures()
+        self._init_steps()
+        self._reset_dirty_state()
+        log.info("オブジェクト参照を再解決しました。")
+
+    def _read_panel_ids(self) -> None:
+        """
+        各パネルの panel_ids カスタムプロパティを一度だけ読み出して検証し、
+        有効パネルと連結ノードID配列・面範囲（panel_quad_start）を保持する。
+        以降の初期化・毎フレーム処理ではカスタムプロパティを参照しない。
+        """
+        self.panel_list: List[bpy.types.Object] = []
+        ids_list: List[List[int]] = []
+        for obj in self.panel_objs:
+            ids = obj.get("panel_ids")
+            if not ids or len(ids) % 4:
+                log.warning(
+                    f"{obj.name}: panel_ids が不正なためアニメーション対象外とします。"
+                )
+                continue
+            self.panel_list.append(obj)
+            ids_list.append(list(ids))
+        self.panel_ids = np.array(
+            [nid for ids in ids_list for nid in ids], dtype=np.int64
         )
-        pos_rep = base_rep + disp_rep
-        pos_other = base_other + disp_other
+        self.panel_quad_start = np.cumsum([0] + [len(ids) // 4 for ids in ids_list])
 
-        try:
-            if obj.type == "ARMATURE":
-                arm = obj
-                pb_rep = arm.pose.bones.get("Bone_Rep")
-                if pb_rep:
-                    pb_rep.location = (
-                        arm.matrix_world.inverted() @ pos_rep - pb_rep.bone.head_local
-                    )
-                pb_oth = arm.pose.bones.get("Bone_Other")
-                if pb_oth:
-                    pb_oth.location = (
-                        arm.matrix_world.inverted() @ pos_other - pb_oth.bone.head_local
-                    )
-            else:
-                obj.location = pos_rep
-        except Exception as e:
-            log.error(f"Sandbag animation update failed for {obj.name}: {e}")
-
-    # パネル更新
-    for obj in panel_objs:
-        ids = obj.get("panel_ids")
-        if not ids or len(ids) != 4:
-            continue
-        verts: List[Vector] = []
-        for nid in ids:
-            if nid in node_objs:
-                verts.append(node_objs[nid].location)
-            else:
-                verts.append(
-                    base_sandbag_pos.get(nid, Vector())
-                    + sandbag_anim_data.get(nid, {}).get(scene.frame_current, Vector())
+    def _read_sandbag_ids(self) -> None:
+        """
+        サンドバッグの rep_node_id / other_node_id を一度だけ読み出し、
+        両方を持つものを (オブジェクト, rep_id, other_id) の平坦なリストにまとめる。
+        """
+        self.sandbag_units: List[Tuple[bpy.types.Object, int, int]] = []
+        for obj in self.sandbag_objs.values():
+            rep_id = obj.get("rep_node_id")
+            other_id = obj.get("other_node_id")
+            if rep_id is None or other_id is None:
+                continue
+            self.sandbag_units.append((obj, rep_id, other_id))
+
+    def _init_panel_meshes(self) -> None:
+        """
+        各パネルメッシュを4頂点1面（統合メッシュは4k頂点k面）＋UVの固定トポロジで一度だけ構築する。
+        頂点順は panel_ids（面ごとに a, b, d, c）の順に一致させる。
+        UV は PanelBuilder が生成時に設定済みのため、トポロジを作り直した場合や
+        UV レイヤが無い場合にのみ書き込む。
+        """
+        start = self.panel_quad_start
+        for i, obj in enumerate(self.panel_list):
+            n_quads = int(start[i + 1] - start[i])
+            mesh = obj.data
+            changed = False
+            if len(mesh.vertices) != 4 * n_quads or len(mesh.polygons) != n_quads:
+                # clear_geometry は UV レイヤも削除する
+                mesh.clear_geometry()
+                mesh.from_pydata(
+                    [(0.0, 0.0, 0.0)] * (4 * n_quads),
+                    [],
+                    [tuple(range(4 * q, 4 * q + 4)) for q in range(n_quads)],
                 )
-        mesh = obj.data
-        mesh.clear_geometry()
-        bm = bmesh.new()
-        uv_layer = bm.loops.layers.uv.new(UV_MAP_NAME)
-        vlist = [bm.verts.new(v) for v in verts]
-        face = bm.faces.new(vlist)
-        for loop, uv in zip(face.loops, [(0, 0), (1, 0), (1, 1), (0, 1)]):
-            loop[uv_layer].uv = uv
-        bm.to_mesh(mesh)
-        bm.free()
-
-    # 屋根更新
-    if roof_obj and roof_quads:
-        mesh = roof_obj.data
+                changed = True
+            if mesh.uv_layers.get(UV_MAP_NAME) is None:
+                uv_layer = mesh.uv_layers.new(name=UV_MAP_NAME)
+                uv_layer.data.foreach_set("uv", QUAD_UVS * n_quads)
+                changed = True
+            if changed:
+                mesh.update()
+
+    def _init_roof_mesh(self) -> None:
+        """
+        roof_quads から屋根メッシュ（頂点・面・UV）を一度だけ構築し、
+        ノードID→頂点インデックスの対応を roof_nids に保持する。
+        """
+        if not self.roof_obj or not self.roof_quads:
+            return
+        # 面の頂点は一意なノードID配列への整数インデックスとして表す（辞書を介さない）
+        unique_nids, quad_rows = np.unique(
+            np.asarray(self.roof_quads, dtype=np.int64), return_inverse=True
+        )
+        self.roof_nids = unique_nids.tolist()
+
+        verts = [
+            tuple(
+                self.base_node_pos[nid]
+                if nid in self.base_node_pos
+                else self.base_sandbag_pos.get(nid, ZERO)
+            )
+            for nid in self.roof_nids
+        ]
+        faces = quad_rows.reshape(-1, 4).tolist()
+        mesh = self.roof_obj.data
         mesh.clear_geometry()
-        bm = bmesh.new()
-        uv_layer = bm.loops.layers.uv.new(UV_MAP_NAME)
-        vert_map: Dict[int, bmesh.types.BMVert] = {}
-        for quad in roof_quads:
-            for nid in quad:
-                if nid in node_objs:
-                    pos = node_objs[nid].location
-                else:
-                    pos = base_sandbag_pos.get(nid, Vector()) + sandbag_anim_data.get(
-                        nid, {}
-                    ).get(scene.frame_current, Vector())
-                if nid not in vert_map:
-                    vert_map[nid] = bm.verts.new(pos)
-        for bl, br, tr, tl in roof_quads:
-            f = bm.faces.new([vert_map[n] for n in (bl, br, tr, tl)])
-            for loop, uv in zip(f.loops, [(0, 0), (1, 0), (1, 1), (0, 1)]):
-                loop[uv_layer].uv = uv
-        bm.to_mesh(mesh)
-        bm.free()
-
-    # 柱・梁再配置
-    up = Vector((0, 0, 1))
-    for obj, a, b in member_objs:
-        p1 = (
-            node_objs[a].location
-            if a in node_objs
-            else base_sandbag_pos.get(a, Vector())
-            + sandbag_anim_data.get(a, {}).get(scene.frame_current, Vector())
+        mesh.from_pydata(verts, [], faces)
+        uv_layer = mesh.uv_layers.get(UV_MAP_NAME) or mesh.uv_layers.new(
+            name=UV_MAP_NAME
         )
-        p2 = (
-            node_objs[b].location
-            if b in node_objs
-            else base_sandbag_pos.get(b, Vector())
-            + sandbag_anim_data.get(b, {}).get(scene.frame_current, Vector())
+        uv_layer.data.foreach_set("uv", QUAD_UVS * len(faces))
+        mesh.update()
+
+    def _init_positions(
+        self,
+        anim_data: Dict[int, Dict[int, Vector]],
+        sandbag_anim_data: Dict[int, Dict[int, Vector]],
+    ) -> None:
+        """
+        通常ノード・サンドバッグノードの座標を1本の (N, 3) float32 配列で扱うため、
+        ノードID→行番号の対応と行ごとの基準座標・変位テーブルを用意する。
+        パネル・屋根・部材・サンドバッグが参照するIDで基準座標を持たないものは原点扱い。
+        """
+        self.row_of: Dict[int, int] = {}
+        row_frames: List[Dict[int, Vector]] = []
+        bases: List[Vector] = []
+
+        def add_row(nid: int, base: Vector, frames: Dict[int, Vector]) -> None:
+            if nid not in self.row_of:
+                self.row_of[nid] = len(row_frames)
+                row_frames.append(frames)
+                bases.append(base)
+
+        for nid, base in self.base_node_pos.items():
+            add_row(nid, base, anim_data.get(nid, {}))
+        for nid, base in self.base_sandbag_pos.items():
+            add_row(nid, base, sandbag_anim_data.get(nid, {}))
+
+        referenced: List[int] = list(self.roof_nids)
+        referenced.extend(self.panel_ids.tolist())
+        for _, a, b in self.member_objs:
+            referenced.extend((a, b))
+        for _, rep_id, other_id in self.sandbag_units:
+            referenced.extend((rep_id, other_id))
+        for nid in referenced:
+            add_row(nid, ZERO, {})
+
+        n = len(row_frames)
+        self.base_positions = np.array(
+            [tuple(base) for base in bases], dtype=np.float32
+        ).reshape(n, 3)
+        self.positions = self.base_positions.copy()
+
+        # {nid: {frame: Vector}} を一度だけ走査し、密な (F, N, 3) テーブルへ変換
+        # （負のフレームは表に載せないため、負のキーのみ・空でも最低1フレーム確保）
+        n_frames = 1 + max(
+            (max(frames) for frames in row_frames if frames), default=0
         )
-        mid = (p1 + p2) * 0.5
-        vec = p2 - p1
-        obj.location = mid
-        axis = up.cross(vec)
-        if axis.length > EPS_AXIS:
-            axis.normalize()
-            angle = up.angle(vec)
-            obj.rotation_mode = "AXIS_ANGLE"
-            obj.rotation_axis_angle = (angle, axis.x, axis.y, axis.z)
+        n_frames = max(n_frames, 1)
+        # (フレーム, 行, 変位) を平坦なリストに集め、1回のファンシーインデックス代入で埋める
+        frame_idx: List[int] = []
+        row_idx: List[int] = []
+        values: List[Vector] = []
+        for row, frames in enumerate(row_frames):
+            frame_idx.extend(frames)
+            row_idx.extend([row] * len(frames))
+            values.extend(frames.values())
+        disp = np.zeros((n_frames, n, 3), dtype=np.float32)
+        if values:
+            f_arr = np.array(frame_idx, dtype=np.int64)
+            keep = f_arr >= 0
+            disp[f_arr[keep], np.array(row_idx, dtype=np.int64)[keep]] = np.array(
+                values, dtype=np.float32
+            ).reshape(-1, 3)[keep]
+
+        # 変位は構造寸法に比べ小さく値域が限られるため、フレーム・軸ごとのスケール付き int16 で保持
+        # （揺れの小さいフレームも最大振幅フレームに引きずられず分解能を保てる）
+        if ANIM_DISP_QUANTIZE:
+            max_abs = (
+                np.abs(disp).max(axis=1) if n else np.zeros((n_frames, 3), np.float32)
+            )
+            self.disp_scale = np.where(max_abs > 0, max_abs / 32767.0, 1.0).astype(
+                np.float32
+            )
+            self.disp_table = np.round(disp / self.disp_scale[:, None, :]).astype(
+                np.int16
+            )
         else:
-            obj.rotation_mode = "QUATERNION"
-            obj.rotation_quaternion = Quaternion((1, 0, 0, 0))
-        length = vec.length
-        orig = obj.get("orig_depth", length)
-        sx, sy, _ = obj.scale
-        obj.scale = (sx, sy, length / orig)
+            self.disp_scale = np.ones((n_frames, 3), dtype=np.float32)
+            self.disp_table = disp
+        self.disp_scale_zero = np.ones(3, dtype=np.float32)
+        self.disp_zero = np.zeros((n, 3), dtype=self.disp_table.dtype)
+        self.disp_row = np.empty((n, 3), dtype=np.float32)
+        self.row_moved = np.zeros(n, dtype=bool)
+        self.roof_rows = np.array(
+            [self.row_of[nid] for nid in self.roof_nids], dtype=np.int32
+        )
+        self.roof_coords = np.empty((len(self.roof_nids), 3), dtype=np.float32)
+
+    def _init_panels(self) -> None:
+        """
+        全パネル面の頂点座標を1回の np.take で集めるため、行番号を (Q, 4) 配列にまとめる。
+        """
+        row_of = self.row_of
+        self.panel_rows = np.array(
+            [row_of[nid] for nid in self.panel_ids.tolist()], dtype=np.int32
+        ).reshape(-1, 4)
+        self.panel_coords = np.empty((len(self.panel_rows), 4, 3), dtype=np.float32)
+        self.panel_delta = np.empty_like(self.panel_coords)
+
+    def _init_members(self) -> None:
+        """
+        柱・梁の一括ベクトル演算用に、端点座標・基準長・スケール・回転のバッファを確保する。
+        """
+        m = len(self.member_objs)
+        self.member_list = [obj for obj, _, _ in self.member_objs]
+        self.member_rows_a = np.array(
+            [self.row_of[a] for _, a, _ in self.member_objs], dtype=np.int32
+        )
+        self.member_rows_b = np.array(
+            [self.row_of[b] for _, _, b in self.member_objs], dtype=np.int32
+        )
+        self.member_p1 = np.empty((m, 3), dtype=np.float32)
+        self.member_p2 = np.empty((m, 3), dtype=np.float32)
+        self.member_orig_depth = np.array(
+            [obj.get("orig_depth", np.nan) for obj in self.member_list],
+            dtype=np.float32,
+        )
+        self.member_scale = np.array(
+            [tuple(obj.scale) for obj in self.member_list], dtype=np.float32
+        ).reshape(m, 3)
+        self.member_quat = np.zeros((m, 4), dtype=np.float32)
+        self.member_vec = np.empty((m, 3), dtype=np.float32)
+        self.member_mid = np.empty((m, 3), dtype=np.float32)
+        self.member_vhat = np.empty((m, 3), dtype=np.float32)
+        self.member_len = np.empty(m, dtype=np.float32)
+        # 回転表現は QUATERNION に固定し、毎フレームのモード切り替えを行わない
+        # （refresh_objects からの再初期化時も、既に一致していれば変換を起こさない）
+        for obj in self.member_list:
+            if obj.rotation_mode != "QUATERNION":
+                obj.rotation_mode = "QUATERNION"
+        # location / rotation_quaternion / scale を foreach_set で一括書き込みするためのコレクション
+        self.member_coll, self.member_order, self.member_batch = (
+            _build_location_batch(
+                MEMBER_ANIM_COLLECTION_NAME,
+                [(obj, i) for i, obj in enumerate(self.member_list)],
+            )
+        )
+        self.member_locs = np.empty((m, 3), dtype=np.float32)
+        self.member_quats = np.empty((m, 4), dtype=np.float32)
+        self.member_scales = np.empty((m, 3), dtype=np.float32)
+
+    def _init_location_batches(self) -> None:
+        """
+        ノード球・非Armatureサンドバッグの location を foreach_set で一括書き込みするため、
+        それぞれ専用コレクションにまとめ、コレクション内の並び順に対応する行番号を保持する。
+        """
+        self.node_coll, self.node_rows, self.node_batch = _build_location_batch(
+            NODE_ANIM_COLLECTION_NAME,
+            [
+                (obj, self.row_of[nid])
+                for nid, obj in self.node_objs.items()
+                if nid in self.base_node_pos
+            ],
+        )
+        self.sandbag_coll, self.sandbag_rows, self.sandbag_batch = (
+            _build_location_batch(
+                SANDBAG_ANIM_COLLECTION_NAME,
+                [
+                    (obj, self.row_of[rep_id])
+                    for obj, rep_id, _ in self.sandbag_units
+                    if obj.type != "ARMATURE"
+                ],
+            )
+        )
+        self.node_locs = np.empty((len(self.node_rows), 3), dtype=np.float32)
+        self.sandbag_locs = np.empty((len(self.sandbag_rows), 3), dtype=np.float32)
+
+    def _init_armatures(self) -> None:
+        """
+        Armature サンドバッグを (ボーン情報リスト, 行番号配列) の並列配列にまとめ、
+        毎フレームの種別判定・カスタムプロパティ参照・ボーン名検索を初期化時の一度だけにする。
+        head_local はリグ固有の定数のためコピーを保持する。
+        """
+        self.arm_bones: List[tuple] = []
+        rows: List[Tuple[int, int]] = []
+        for obj, rep_id, other_id in self.sandbag_units:
+            if obj.type != "ARMATURE":
+                continue
+            pb_rep = obj.pose.bones.get("Bone_Rep")
+            pb_oth = obj.pose.bones.get("Bone_Other")
+            self.arm_bones.append(
+                (
+                    obj,
+                    pb_rep,
+                    pb_rep.bone.head_local.copy() if pb_rep else None,
+                    pb_oth,
+                    pb_oth.bone.head_local.copy() if pb_oth else None,
+                )
+            )
+            rows.append((self.row_of[rep_id], self.row_of[other_id]))
+        self.arm_rows = np.array(rows, dtype=np.int32).reshape(-1, 2)
+        self.arm_coords = np.empty((len(rows), 2, 3), dtype=np.float32)
+
+    def _init_steps(self) -> None:
+        """
+        対象の存在する更新処理だけを毎フレーム呼び出す順に並べる。
+        steps は毎フレーム、move_steps はいずれかのノードが動いたフレームのみ実行する。
+        """
+        self.steps: List[Callable[["BuildingAnimCache"], None]] = []
+        if self.node_batch:
+            self.steps.append(_update_nodes)
+        if self.sandbag_batch:
+            self.steps.append(_update_sandbags)
+        if self.arm_bones:
+            self.steps.append(_update_armatures)
+        self.move_steps: List[Callable[["BuildingAnimCache"], None]] = []
+        if self.panel_list:
+            self.move_steps.append(_update_panels)
+        if self.roof_obj and self.roof_nids:
+            self.move_steps.append(_update_roof)
+        if self.member_list:
+            self.move_steps.append(_update_members)
+
+    def _reset_dirty_state(self) -> None:
+        """前回書き込み座標・フレームを未設定に戻し、次フレームで全件更新させる。"""
+        self.last_frame: Optional[int] = None
+        m = len(self.member_objs)
+        self.positions_last = np.full_like(self.positions, np.nan)
+        self.panel_last = np.full_like(self.panel_coords, np.nan)
+        self.roof_last = np.full_like(self.roof_coords, np.nan)
+        self.member_last_p1 = np.full((m, 3), np.nan, np.float32)
+        self.member_last_p2 = np.full((m, 3), np.nan, np.float32)
+
+
+def _build_location_batch(
+    name: str, targets: List[Tuple[bpy.types.Object, int]]
+) -> Tuple[bpy.types.Collection, np.ndarray, List[bpy.types.Object]]:
+    """
+    targets のオブジェクトを新規コレクションにリンクし、
+    (コレクション, 並び順に対応する行番号配列, 並び順のオブジェクトリスト) を返す。
+    オブジェクトリストは毎フレームの update_tag 用で、コレクションを都度走査しないために保持する。
+    """
+    old = bpy.data.collections.get(name)
+    if old is not None:
+        bpy.data.collections.remove(old)
+    coll = bpy.data.collections.new(name)
+    row_by_ptr: Dict[int, int] = {}
+    for obj, row in targets:
+        coll.objects.link(obj)
+        row_by_ptr[obj.as_pointer()] = row
+    objs = list(coll.objects)
+    rows = np.array([row_by_ptr[obj.as_pointer()] for obj in objs], dtype=np.int32)
+    return coll, rows, objs
+
+
+def _write_locations(
+    coll: bpy.types.Collection,
+    objs: List[bpy.types.Object],
+    rows: np.ndarray,
+    positions: np.ndarray,
+    buf: np.ndarray,
+    row_moved: np.ndarray,
+) -> None:
+    """
+    positions[rows] をコレクション内オブジェクトの location に一括で書き込む。
+    対象行が1つも動いていなければ何もせず、update_tag は動いたオブジェクトにのみ行う。
+    """
+    moved = np.flatnonzero(row_moved[rows])
+    if not len(moved):
+        return
+    np.take(positions, rows, axis=0, out=buf)
+    coll.objects.foreach_set("location", buf.ravel())
+    _tag_transforms_updated([objs[i] for i in moved])
+
+
+def _write_member_transforms(cache: BuildingAnimCache) -> None:
+    """
+    計算済みの部材中点・回転・スケールをコレクション内の並び順に並べ替え、
+    location / rotation_quaternion / scale をそれぞれ1回の foreach_set で書き込む。
+    """
+    order = cache.member_order
+    objects = cache.member_coll.objects
+    np.take(cache.member_mid, order, axis=0, out=cache.member_locs)
+    np.take(cache.member_quat, order, axis=0, out=cache.member_quats)
+    np.take(cache.member_scale, order, axis=0, out=cache.member_scales)
+    objects.foreach_set("location", cache.member_locs.ravel())
+    objects.foreach_set("rotation_quaternion", cache.member_quats.ravel())
+    objects.foreach_set("scale", cache.member_scales.ravel())
+    _tag_transforms_updated(cache.member_batch)
+
+
+def _tag_transforms_updated(objs: List[bpy.types.Object]) -> None:
+    """foreach_set は更新通知を行わないため、変換の再評価を明示的に要求する。"""
+    for obj in objs:
+        obj.update_tag(refresh={"OBJECT"})
+
+
+def on_frame_building(
+    scene: bpy.types.Scene,
+    cache: BuildingAnimCache,
+) -> None:
+    """
+    シーン更新ごとに呼び出され、各種オブジェクトの位置・形状をアニメーションデータに基づき更新する。
+    オブジェクト参照が失効していた場合（Undo等）は一度だけ再解決して再実行する。
+
+    Args:
+        scene: 現在のBlenderシーン
+        cache: 初期化時に構築した BuildingAnimCache
+    """
+    update_building_frame(scene.frame_current, cache)
+
+
+def update_building_frame(frame: int, cache: BuildingAnimCache) -> None:
+    """
+    指定フレームで建物を更新する（on_frame_building の本体）。
+    フレーム番号を一度だけ読む統合ハンドラから直接呼び出せるよう、scene を受け取らない。
+
+    Args:
+        frame: 反映するフレーム番号（scene.frame_current）
+        cache: 初期化時に構築した BuildingAnimCache
+    """
+    # 同一フレームの再通知（一時停止中・静止画レンダ等）のみ省略する
+    # （変位テーブル範囲外でも地面側の親は動き続けるため、Armature の更新は止めない。
+    #   ノード等は変位0で動かないため、書き込みは dirty 判定で省略される）
+    if frame == cache.last_frame:
+        return
+    try:
+        _update_building(frame, cache)
+    except ReferenceError as e:
+        log.warning(f"オブジェクト参照が失効しています（{e}）。再解決します。")
+        cache.refresh_objects()
+        _update_building(frame, cache)
+    cache.last_frame = frame
+
+
+def _update_building(frame: int, cache: BuildingAnimCache) -> None:
+    """
+    update_building_frame の本体。キャッシュ済みの参照のみを使って1フレーム分を更新する。
+    frame は呼び出し元で一度だけ取得した scene.frame_current。
+    対象の無い更新処理は初期化時に steps / move_steps から除外済み。
+    """
+    # 全ノード座標を一括計算し、前回の移動判定時から EPS_MOVE 以上動いた行（dirty set）を求める
+    # （以降の部材・面はここから参照し、RNA読み戻しはしない）
+    disp_table = cache.disp_table
+    if 0 <= frame < len(disp_table):
+        disp, scale = disp_table[frame], cache.disp_scale[frame]
+    else:
+        disp, scale = cache.disp_zero, cache.disp_scale_zero
+    update_positions(
+        cache.base_positions,
+        disp,
+        scale,
+        cache.positions,
+        cache.positions_last,
+        cache.row_moved,
+        cache.disp_row,
+    )
+    for step in cache.steps:
+        step(cache)
+
+    # どの行も前回の移動判定から動いていなければ（静止フレーム）、面・部材の判定ごと省略する
+    # （Armature はワールド行列にも依存するため steps 側で常に更新する）
+    if not cache.row_moved.any():
+        return
+    for step in cache.move_steps:
+        step(cache)
+
+
+def _update_nodes(cache: BuildingAnimCache) -> None:
+    """ノード球位置を一括更新する（動いた行を含む場合のみ）。"""
+    _write_locations(
+        cache.node_coll,
+        cache.node_batch,
+        cache.node_rows,
+        cache.positions,
+        cache.node_locs,
+        cache.row_moved,
+    )
+
+
+def _update_sandbags(cache: BuildingAnimCache) -> None:
+    """非Armatureサンドバッグ位置を一括更新する（動いた行を含む場合のみ）。"""
+    _write_locations(
+        cache.sandbag_coll,
+        cache.sandbag_batch,
+        cache.sandbag_rows,
+        cache.positions,
+        cache.sandbag_locs,
+        cache.row_moved,
+    )
+
+
+def _update_armatures(cache: BuildingAnimCache) -> None:
+    """
+    Armatureサンドバッグをボーン単位で更新する。
+    1つの Armature で失敗しても他の Armature の更新は続ける（ReferenceError は呼び出し元で再解決）。
+    """
+    arm_coords = cache.arm_coords
+    np.take(cache.positions, cache.arm_rows, axis=0, out=arm_coords)
+    # ワールド座標の受け皿は使い回し、差分は in-place で求めて Vector の生成を抑える
+    world = Vector()
+    for (arm, pb_rep, head_rep, pb_oth, head_oth), (rep, other) in zip(
+        cache.arm_bones, arm_coords
+    ):
+        try:
+            # 逆行列は Armature ごとに1回だけ求め、両ボーンで共用する
+            inv_mw = arm.matrix_world.inverted_safe()
+            if pb_rep:
+                world.xyz = rep
+                loc = inv_mw @ world
+                loc -= head_rep
+                pb_rep.location = loc
+            if pb_oth:
+                world.xyz = other
+                loc = inv_mw @ world
+                loc -= head_oth
+                pb_oth.location = loc
+        except ReferenceError:
+            raise
+        except Exception as e:
+            log.error(f"Sandbag animation update failed for {arm.name}: {e}")
+
+
+def _update_panels(cache: BuildingAnimCache) -> None:
+    """
+    パネルを更新する（トポロジ固定、頂点座標のみ書き換え）。
+    座標の収集と移動判定は全パネル一括で行い、bpy への書き込みだけを逐次実行する。
+    """
+    coords = cache.panel_coords
+    np.take(cache.positions, cache.panel_rows, axis=0, out=coords)
+    delta = cache.panel_delta
+    np.subtract(coords, cache.panel_last, out=delta)
+    np.abs(delta, out=delta)
+    quad_moved = ~(delta.max(axis=(1, 2)) < EPS_MOVE)
+    if not quad_moved.any():
+        return
+    cache.panel_last[quad_moved] = coords[quad_moved]
+    start = cache.panel_quad_start
+    moved = np.flatnonzero(np.logical_or.reduceat(quad_moved, start[:-1]))
+    panel_list = cache.panel_list
+    for i in moved:
+        mesh = panel_list[i].data
+        mesh.vertices.foreach_set("co", coords[start[i] : start[i + 1]].ravel())
+        mesh.update()
+
+
+def _update_roof(cache: BuildingAnimCache) -> None:
+    """屋根を更新する（トポロジ固定、頂点座標のみ書き換え）。"""
+    coords = cache.roof_coords
+    np.take(cache.positions, cache.roof_rows, axis=0, out=coords)
+    if np.abs(coords - cache.roof_last).max() < EPS_MOVE:
+        return
+    cache.roof_last[:] = coords
+    mesh = cache.roof_obj.data
+    mesh.vertices.foreach_set("co", coords.ravel())
+    mesh.update()
+
+
+def _update_members(cache: BuildingAnimCache) -> None:
+    """柱・梁を再配置する（端点を収集し、中点・回転・長さを一括計算）。"""
+    p1 = cache.member_p1
+    p2 = cache.member_p2
+    np.take(cache.positions, cache.member_rows_a, axis=0, out=p1)
+    np.take(cache.positions, cache.member_rows_b, axis=0, out=p2)
+    # 全部材を foreach_set で一括書き込みするため、1本でも動いていれば全件を再計算する
+    unchanged = (np.abs(p1 - cache.member_last_p1).max(axis=1) < EPS_MOVE) & (
+        np.abs(p2 - cache.member_last_p2).max(axis=1) < EPS_MOVE
+    )
+    if unchanged.all():
+        return
+    cache.member_last_p1[:] = p1
+    cache.member_last_p2[:] = p2
+    # 中点・回転・Zスケールの一括計算（numba があればコンパイル済みカーネルを使用）
+    member_transforms(
+        p1,
+        p2,
+        cache.member_orig_depth,
+        cache.member_mid,
+        cache.member_quat,
+        cache.member_scale,
+        cache.member_vec,
+        cache.member_vhat,
+        cache.member_len,
+    )
+    _write_member_transforms(cache)
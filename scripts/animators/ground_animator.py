@@ -7,18 +7,19 @@
 - ground_obj等の独立アニメ処理も将来分離責任。
 
 注意点:
-- Blenderイベント登録はframe_change_preのみ（clear/重複管理は運用責任）
+- Blenderイベント登録はframe_change_preのみ（重複は register_frame_handler で防止）
 - ground_obj用ハンドラ分離など設計拡張余地あり
 
 TODO:
 - ground_obj独立アニメハンドラの導入
-- イベント登録解除/重複防止/多重登録管理
+- イベント登録解除
 """
 
 import bpy
+import numpy as np
 from mathutils import Vector
-from typing import Optional, Dict
-from utils import setup_logging
+from typing import Callable, Optional, Dict
+from utils import setup_logging, register_frame_handler
 
 log = setup_logging("ground_animator")
 
@@ -39,17 +40,55 @@ def register_ground_anim_handler(
         None
 
     注意:
-        - ハンドラはappendのみ。多重登録/解除は呼び出し元で管理推奨。
+        - 前回登録した地面ハンドラ（key="ground"）のみ置き換える（多重登録しない）。
+        - 建物アニメと同時に使う場合は make_ground_frame_updater を統合ハンドラから呼ぶ。
     """
+    update = make_ground_frame_updater(motion_parent, earthquake_anim_data)
 
     def _on_frame(scene):
-        disp = Vector((0, 0, 0))
-        if earthquake_anim_data is not None:
-            disp = earthquake_anim_data.get(scene.frame_current, Vector((0, 0, 0)))
+        update(scene.frame_current)
+
+    register_frame_handler(_on_frame, "ground")
+
+
+def make_ground_frame_updater(
+    motion_parent: bpy.types.Object,
+    earthquake_anim_data: Optional[Dict[int, Vector]] = None,
+) -> Callable[[int], None]:
+    """
+    役割:
+        フレーム番号を受け取り motion_parent の.locationを更新する関数を生成する（登録はしない）。
+
+    引数:
+        motion_parent: アニメーション対象のEmpty（建物群の親）
+        earthquake_anim_data: {frame: Vector(dx, dy, dz)}（なければ静止）
+
+    返り値:
+        update(frame) 関数
+
+    注意:
+        - 変位は生成時に (フレーム数, 3) の配列へ展開し、毎フレームは添字参照のみ行う。
+    """
+    # {frame: Vector} を密なテーブルへ一度だけ変換（データ無しフレームは0）
+    frames = {
+        f: vec for f, vec in (earthquake_anim_data or {}).items() if f >= 0
+    }
+    disp_table = np.zeros((max(frames, default=-1) + 1, 3), dtype=np.float32)
+    if frames:
+        disp_table[list(frames)] = np.array(list(frames.values()), dtype=np.float32)
+    zero = np.zeros(3, dtype=np.float32)
+
+    last_frame = None
+
+    def update(frame: int) -> None:
+        nonlocal last_frame
+        # 同一フレームの再通知では書き込まない
+        if frame == last_frame:
+            return
+        last_frame = frame
+        disp = disp_table[frame] if 0 <= frame < len(disp_table) else zero
         if motion_parent:
             motion_parent.location = disp
-            log.debug(
-                f"motion_parent.location set to {tuple(disp)} at frame {scene.frame_current}"
-            )
+            log.debug("motion_parent.location set to %s at frame %s", disp, frame)
 
-    bpy.app.handlers.frame_change_pre.append(_on_frame)
+    return update
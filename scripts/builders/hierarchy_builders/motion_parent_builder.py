@@ -84,7 +84,10 @@ def set_parent(
         if obj:
             obj.parent = parent_obj
             log.debug(
-                f"{label}オブジェクト「{obj.name}」を「{parent_obj.name}」に親子付けしました。"
+                "%sオブジェクト「%s」を「%s」に親子付けしました。",
+                label,
+                obj.name,
+                parent_obj.name,
             )
             counts[label] += 1
 
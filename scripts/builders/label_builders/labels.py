@@ -50,10 +50,11 @@ def create_label(
     if not isinstance(offset, Vector):
         offset = Vector(offset)
 
-    # テキストオブジェクトを新規作成
-    bpy.ops.object.text_add()
-    text_obj = bpy.context.object
-    text_obj.name = f"{name_prefix}_{obj.name}"
+    # テキストオブジェクトを新規作成（オペレータを使わず FONT カーブから直接生成）
+    name = f"{name_prefix}_{obj.name}"
+    curve = bpy.data.curves.new(name, type="FONT")
+    text_obj = bpy.data.objects.new(name, curve)
+    bpy.context.collection.objects.link(text_obj)
     text_obj.data.body = text
     text_obj.data.align_x = "CENTER"
     text_obj.data.align_y = "CENTER"
@@ -13,3 +13,9 @@ def apply_all_materials(
         node_objs, sandbag_objs, panel_objs, roof_obj, member_objs, ground_obj
     )
     applicator.build()
+
+
+__all__ = [
+    "MaterialApplicator",
+    "apply_all_materials",
+]
@@ -9,7 +9,8 @@
 """
 
 import bpy
-from typing import Dict, List, Optional, Union, Tuple
+import logging
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union, Tuple
 from utils import setup_logging
 from builders.base import BuilderBase
 from .material_factories import (
@@ -22,11 +23,137 @@ from .material_factories import (
     create_sandbag_texture_material,
     create_ground_material,
 )
+from configs import BEAM_OBJ_PREFIX, COLUMN_OBJ_PREFIX
 from configs.paths import TBAGS_TEXTURE
 
 log = setup_logging("MaterialApplicator")
 
 
+def _set_single_material(data: bpy.types.ID, mat: bpy.types.Material) -> None:
+    """
+    役割:
+        data のマテリアルスロットを mat 1つだけにする。
+        既にスロットが1つなら clear/append せずその場で差し替え（同じなら何もしない）。
+    """
+    mats = data.materials
+    if len(mats) == 1:
+        if mats[0] != mat:
+            mats[0] = mat
+    else:
+        mats.clear()
+        mats.append(mat)
+
+
+def _bulk_assign(objs: Iterable[bpy.types.Object], mat: bpy.types.Material) -> int:
+    """
+    役割:
+        objs のメッシュデータを1パスで重複なく集め、各データに mat を1つだけ設定する。
+        共有メッシュ（インスタンス）はデータ単位で1回だけ処理される。
+
+    返り値:
+        int: 適用したオブジェクト数（メッシュ以外は警告してスキップ）
+    """
+    datas = {}
+    count = 0
+    for obj in objs:
+        data = obj.data
+        if not isinstance(data, bpy.types.Mesh):
+            log.warning("%s にマテリアルスロットがないためスキップします。", obj.name)
+            continue
+        datas[data.as_pointer()] = data
+        count += 1
+    for data in datas.values():
+        _set_single_material(data, mat)
+    return count
+
+
+def _assign_one(obj: Optional[bpy.types.Object], mat: bpy.types.Material) -> int:
+    """
+    役割:
+        単体オブジェクト（屋根・地面）に mat を設定する。
+
+    返り値:
+        int: 適用したら 1、オブジェクトなし・スロットなしなら 0
+    """
+    if not obj:
+        return 0
+    data = obj.data
+    if not isinstance(data, bpy.types.Mesh):
+        log.warning("%s にマテリアルスロットがないためスキップします。", obj.name)
+        return 0
+    _set_single_material(data, mat)
+    return 1
+
+
+def _children_map() -> Dict[int, List[bpy.types.Object]]:
+    """
+    役割:
+        bpy.data.objects を1回だけ走査し、親（as_pointer）→ 子オブジェクトリストの対応を作る。
+        Object.children / children_recursive はアクセスのたびに全オブジェクトを走査するため、
+        複数の親を辿る場合はこの対応を共有する。
+    """
+    children_of: Dict[int, List[bpy.types.Object]] = {}
+    for obj in bpy.data.objects:
+        parent = obj.parent
+        if parent is not None:
+            children_of.setdefault(parent.as_pointer(), []).append(obj)
+    return children_of
+
+
+def _iter_mesh_descendants(
+    root: bpy.types.Object, children_of: Dict[int, List[bpy.types.Object]]
+) -> Iterator[bpy.types.Object]:
+    """
+    役割:
+        root 以下の子孫から、データを持つ MESH オブジェクトのみを順に返す。
+        子の参照は _children_map() の対応を使う。
+    """
+    stack = list(children_of.get(root.as_pointer(), ()))
+    while stack:
+        obj = stack.pop()
+        stack.extend(children_of.get(obj.as_pointer(), ()))
+        if obj.type == "MESH" and isinstance(obj.data, bpy.types.Mesh):
+            yield obj
+
+
+def _assign_sandbag_tree(
+    bases: Iterable[bpy.types.Object],
+    get_mat: Callable[[], bpy.types.Material],
+) -> int:
+    """
+    役割:
+        サンドバッグの Empty 以下の全 Mesh にマテリアルを設定する（共有メッシュは1回のみ）。
+        マテリアルは最初の Mesh が見つかった時点で get_mat() により1回だけ生成する。
+
+    返り値:
+        int: 適用した Mesh オブジェクト数
+    """
+    count = 0
+    seen = set()
+    mat = None
+    children_of = None
+    for base in bases:
+        if base.type != "EMPTY":
+            continue
+        if children_of is None:
+            children_of = _children_map()
+        for mesh_obj in _iter_mesh_descendants(base, children_of):
+            data = mesh_obj.data
+            key = data.as_pointer()
+            if key in seen:
+                count += 1
+                continue
+            if mat is None:
+                mat = get_mat()
+            try:
+                _set_single_material(data, mat)
+                seen.add(key)
+                count += 1
+            except Exception as e:
+                log.warning("%s へのマテリアル適用に失敗: %s", mesh_obj.name, e)
+    return count
+
+
 class MaterialApplicator(BuilderBase):
     def __init__(
         self,
@@ -42,9 +169,32 @@ class MaterialApplicator(BuilderBase):
         self.sandbag_objs = sandbag_objs
         self.panel_objs = panel_objs
         self.roof_obj = roof_obj
-        self.member_objs = member_objs
+        # (obj, start, end) タプルはオブジェクトのみに正規化しておく（build 毎の判定を省く）
+        self.member_objs: List[bpy.types.Object] = [
+            item[0] if isinstance(item, tuple) else item for item in member_objs
+        ]
         self.ground_obj = ground_obj
 
+    def _sandbag_material(self) -> bpy.types.Material:
+        """
+        役割:
+            サンドバッグ用テクスチャマテリアル（タイル数=6）を生成して返す。
+            テクスチャの読み込みに失敗した場合は緑マテリアルを返す。
+        """
+        try:
+            return create_sandbag_texture_material(
+                img_path=TBAGS_TEXTURE,
+                alpha=1.0,
+                tile=6.0
+            )
+        except Exception as e:
+            log.warning(
+                "Sandbag texture load failed (%s): %s — 緑マテリアルを使用します。",
+                TBAGS_TEXTURE,
+                e,
+            )
+            return create_sandbag_material()
+
     def build(self) -> None:
         """
         役割:
@@ -56,121 +206,53 @@ class MaterialApplicator(BuilderBase):
         mat_col = create_column_material()
         mat_beam = create_beam_material()
         mat_node = create_node_material()
-        mat_sandbag = create_sandbag_material()
         mat_ground = create_ground_material()
 
-        # サンドバッグ用テクスチャマテリアルを事前生成（タイル数=6に設定）
-        try:
-            mat_sandbag_tex = create_sandbag_texture_material(
-                img_path=TBAGS_TEXTURE,
-                alpha=1.0,
-                tile=6.0
-            )
-            use_tex = True
-        except Exception as e:
-            log.warning(
-                f"Sandbag texture load failed ({TBAGS_TEXTURE}): {e} — 緑マテリアルを使用します。"
-            )
-            mat_sandbag_tex = None
-            use_tex = False
-
-        # カウント用
-        counts = {
-            "パネル": 0,
-            "屋根": 0,
-            "柱": 0,
-            "梁": 0,
-            "ノード": 0,
-            "サンドバッグ": 0,
-            "地面": 0,
-        }
-
         # 壁パネル
-        for obj in self.panel_objs:
-            if not getattr(obj, "data", None) or not hasattr(obj.data, "materials"):
-                log.warning(
-                    f"{obj.name} にマテリアルスロットがないためスキップします。"
-                )
-                continue
-            obj.data.materials.clear()
-            obj.data.materials.append(mat_wall)
-            counts["パネル"] += 1
+        n_panel = _bulk_assign(self.panel_objs, mat_wall)
 
         # 屋根
-        if self.roof_obj:
-            if getattr(self.roof_obj, "data", None) and hasattr(
-                self.roof_obj.data, "materials"
-            ):
-                self.roof_obj.data.materials.clear()
-                self.roof_obj.data.materials.append(mat_roof)
-                counts["屋根"] += 1
-            else:
-                log.warning(
-                    f"{self.roof_obj.name} にマテリアルスロットがないためスキップします。"
-                )
-
-        # member_objs がタプルの場合にオブジェクトのみを抽出
-        member_objs_clean: List[bpy.types.Object] = []
-        for item in self.member_objs:
-            if isinstance(item, tuple):
-                member_objs_clean.append(item[0])
+        n_roof = _assign_one(self.roof_obj, mat_roof)
+
+        # member_objs を柱・梁に一度だけ振り分け
+        # どちらのプレフィクスにも一致しない名前は警告してスキップする
+        col_objs: List[bpy.types.Object] = []
+        beam_objs: List[bpy.types.Object] = []
+        for obj in self.member_objs:
+            name = obj.name
+            if name.startswith(COLUMN_OBJ_PREFIX):
+                col_objs.append(obj)
+            elif name.startswith(BEAM_OBJ_PREFIX):
+                beam_objs.append(obj)
             else:
-                member_objs_clean.append(item)
+                log.warning("%s は柱・梁のどちらとも判定できないためスキップします。", name)
 
         # 柱・梁
-        for obj in member_objs_clean:
-            if not getattr(obj, "data", None) or not hasattr(obj.data, "materials"):
-                log.warning(
-                    f"{obj.name} にマテリアルスロットがないためスキップします。"
-                )
-                continue
-            obj.data.materials.clear()
-            if obj.name.startswith("Column_"):
-                obj.data.materials.append(mat_col)
-                counts["柱"] += 1
-            else:
-                obj.data.materials.append(mat_beam)
-                counts["梁"] += 1
+        n_col = _bulk_assign(col_objs, mat_col)
+        n_beam = _bulk_assign(beam_objs, mat_beam)
 
         # ノード球
-        for obj in self.node_objs.values():
-            if not getattr(obj, "data", None) or not hasattr(obj.data, "materials"):
-                log.warning(
-                    f"{obj.name} にマテリアルスロットがないためスキップします。"
-                )
-                continue
-            obj.data.materials.clear()
-            obj.data.materials.append(mat_node)
-            counts["ノード"] += 1
+        n_node = _bulk_assign(self.node_objs.values(), mat_node)
 
         # サンドバッグ: Empty 以下の全 Mesh にマテリアル適用
-        for base in self.sandbag_objs.values():
-            if base.type != "EMPTY":
-                continue
-            for mesh_obj in base.children_recursive:
-                if mesh_obj.type != "MESH" or not getattr(mesh_obj, "data", None):
-                    continue
-                mat_to_use = mat_sandbag_tex if use_tex else mat_sandbag
-                try:
-                    mesh_obj.data.materials.clear()
-                    mesh_obj.data.materials.append(mat_to_use)
-                    counts["サンドバッグ"] += 1
-                except Exception as e:
-                    log.warning(f"{mesh_obj.name} へのマテリアル適用に失敗: {e}")
+        # （マテリアルは最初の Mesh を処理する時点で生成）
+        n_sandbag = _assign_sandbag_tree(
+            self.sandbag_objs.values(), self._sandbag_material
+        )
 
         # 地面
-        if self.ground_obj:
-            if getattr(self.ground_obj, "data", None) and hasattr(
-                self.ground_obj.data, "materials"
-            ):
-                self.ground_obj.data.materials.clear()
-                self.ground_obj.data.materials.append(mat_ground)
-                counts["地面"] += 1
-            else:
-                log.warning(
-                    f"{self.ground_obj.name} にマテリアルスロットがないためスキップします。"
-                )
+        n_ground = _assign_one(self.ground_obj, mat_ground)
 
-        # ログ出力
-        summary = "、".join(f"{k}:{v}" for k, v in counts.items() if v > 0)
-        log.info(f"マテリアル適用完了: [{summary}]")
+        # ログ出力（件数はループ中は局所変数で持ち、ここで1回だけまとめる）
+        if log.isEnabledFor(logging.INFO):
+            counts = {
+                "パネル": n_panel,
+                "屋根": n_roof,
+                "柱": n_col,
+                "梁": n_beam,
+                "ノード": n_node,
+                "サンドバッグ": n_sandbag,
+                "地面": n_ground,
+            }
+            summary = "、".join(f"{k}:{v}" for k, v in counts.items() if v > 0)
+            log.info("マテリアル適用完了: [%s]", summary)
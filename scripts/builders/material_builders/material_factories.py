@@ -9,6 +9,10 @@
 """
 
 import bpy
+import functools
+import math
+import os
+from typing import Callable, Dict, Optional
 from utils import setup_logging
 from configs import (
     WALL_IMG,
@@ -21,14 +25,96 @@ from configs import (
 
 log = setup_logging("material_factories")
 
+# (ファクトリ名, 引数) → 生成済みマテリアル（セッション内で再利用）
+_MAT_CACHE: Dict[tuple, bpy.types.Material] = {}
 
+
+def _cached(factory: Callable[..., bpy.types.Material]):
+    """
+    役割:
+        ファクトリ関数の結果を (関数名, 引数) ごとにキャッシュするデコレータ。
+        ファイル再読込等でマテリアルが消えていれば（参照無効も含む）作り直す。
+    """
+
+    @functools.wraps(factory)
+    def wrapper(*args, **kwargs) -> bpy.types.Material:
+        key = (factory.__name__, args, tuple(sorted(kwargs.items())))
+        mat = _MAT_CACHE.get(key)
+        if mat is not None:
+            try:
+                if bpy.data.materials.get(mat.name) == mat:
+                    return mat
+            except ReferenceError:
+                pass
+        mat = factory(*args, **kwargs)
+        _MAT_CACHE[key] = mat
+        return mat
+
+    return wrapper
+
+
+def _existing(name: str) -> Optional[bpy.types.Material]:
+    """
+    役割:
+        既に構築済みのマテリアル（出力ノードを持つノードツリー）があれば返す。
+        再ビルド時にノードツリーを作り直さないための早期リターン用。
+    """
+    mat = bpy.data.materials.get(name)
+    if (
+        mat is not None
+        and mat.use_nodes
+        and any(n.type == "OUTPUT_MATERIAL" for n in mat.node_tree.nodes)
+    ):
+        return mat
+    return None
+
+
+def _node_of_type(mat: bpy.types.Material, node_type: str):
+    """マテリアルのノードツリーから node_type の最初のノードを返す（なければ None）"""
+    return next((n for n in mat.node_tree.nodes if n.type == node_type), None)
+
+
+def _same_path(a: str, b: str) -> bool:
+    """Blender 相対パス（//）も含め、2つのファイルパスが同じ場所を指すか"""
+    return os.path.normpath(bpy.path.abspath(a)) == os.path.normpath(
+        bpy.path.abspath(b)
+    )
+
+
+def _texture_matches(mat: bpy.types.Material, img_path: str, alpha: float) -> bool:
+    """
+    役割:
+        構築済みテクスチャマテリアルが完成しており（画像読み込み済み）、
+        画像パス・透明度が指定どおりかを判定する。
+    """
+    tex = _node_of_type(mat, "TEX_IMAGE")
+    mix = _node_of_type(mat, "MIX_SHADER")
+    return (
+        tex is not None
+        and tex.image is not None
+        and _same_path(tex.image.filepath, img_path)
+        and mix is not None
+        and math.isclose(
+            mix.inputs["Fac"].default_value, 1.0 - alpha, abs_tol=1e-6
+        )
+    )
+
+
+@_cached
 def create_texture_material(
     name: str, img_path: str, alpha: float
 ) -> bpy.types.Material:
     """
     役割:
         画像テクスチャ＋透明度マテリアルを生成
+        （画像読み込み済みかつ画像パス・透明度が同じ構築済みマテリアルは再利用）
+
+    例外:
+        画像読み込みに失敗した場合は作りかけのマテリアルを削除してから再送出する。
     """
+    mat = _existing(name)
+    if mat and _texture_matches(mat, img_path, alpha):
+        return mat
     mat = bpy.data.materials.get(name) or bpy.data.materials.new(name)
     mat.use_nodes = True
     mat.blend_method = "BLEND"
@@ -42,9 +128,11 @@ def create_texture_material(
     out = nt.nodes.new(type="ShaderNodeOutputMaterial")
 
     try:
-        tex.image = bpy.data.images.load(img_path)
+        tex.image = bpy.data.images.load(img_path, check_existing=True)
     except Exception as e:
-        log.error(f"Failed to load image for '{name}': {e}")
+        log.error("Failed to load image for '%s': %s", name, e)
+        # 画像なしの未完成マテリアルが次回以降に再利用されないよう削除する
+        bpy.data.materials.remove(mat)
         raise
 
     bsdf.inputs["Roughness"].default_value = 0.8
@@ -56,23 +144,28 @@ def create_texture_material(
     links.new(transp.outputs["BSDF"], mix.inputs[2])
     links.new(mix.outputs["Shader"], out.inputs["Surface"])
 
-    log.debug(f"Texture material '{name}' created (alpha={alpha})")
+    log.debug("Texture material '%s' created (alpha=%s)", name, alpha)
     return mat
 
 
+@_cached
 def create_wall_material() -> bpy.types.Material:
     """壁パネル用テクスチャマテリアル"""
     return create_texture_material("WallMat", WALL_IMG, WALL_ALPHA)
 
 
+@_cached
 def create_roof_material() -> bpy.types.Material:
     """屋根パネル用テクスチャマテリアル"""
     return create_texture_material("RoofMat", ROOF_IMG, ROOF_ALPHA)
 
 
+@_cached
 def create_column_material() -> bpy.types.Material:
     """柱用マテリアル（木目調）"""
     name = "ColumnMat"
+    if mat := _existing(name):
+        return mat
     mat = bpy.data.materials.get(name) or bpy.data.materials.new(name)
     mat.use_nodes = True
     nt = mat.node_tree
@@ -101,9 +194,12 @@ def create_column_material() -> bpy.types.Material:
     return mat
 
 
+@_cached
 def create_beam_material() -> bpy.types.Material:
     """梁用マテリアル（金属調）"""
     name = "BeamMat"
+    if mat := _existing(name):
+        return mat
     mat = bpy.data.materials.get(name) or bpy.data.materials.new(name)
     mat.use_nodes = True
     nt = mat.node_tree
@@ -132,9 +228,12 @@ def create_beam_material() -> bpy.types.Material:
     return mat
 
 
+@_cached
 def create_node_material() -> bpy.types.Material:
     """ノード球用マテリアル（オレンジ色）"""
     name = "NodeMat"
+    if mat := _existing(name):
+        return mat
     mat = bpy.data.materials.get(name) or bpy.data.materials.new(name)
     mat.use_nodes = True
     nt = mat.node_tree
@@ -152,9 +251,12 @@ def create_node_material() -> bpy.types.Material:
     return mat
 
 
+@_cached
 def create_sandbag_material() -> bpy.types.Material:
     """サンドバッグ用マテリアル（緑色）"""
     name = "SandbagMat"
+    if mat := _existing(name):
+        return mat
     mat = bpy.data.materials.get(name) or bpy.data.materials.new(name)
     mat.use_nodes = True
     nt = mat.node_tree
@@ -170,6 +272,7 @@ def create_sandbag_material() -> bpy.types.Material:
     log.debug("Sandbag material created")
     return mat
 
+@_cached
 def create_sandbag_texture_material(
     img_path: str,
     alpha: float = 1.0,
@@ -179,33 +282,50 @@ def create_sandbag_texture_material(
     サンドバッグ専用テクスチャマテリアル。
     img_path の画像を読み込んで Principled BSDF に繰り返し(tile)を設定。
     tile が大きいほど細かくタイルされる（デフォルト 4 回繰り返し）。
+    構築済み（画像パス・透明度が同じでマッピングノードあり）の場合は
+    繰り返し回数のみ合わせて返す。
     """
+    mat = _existing("SandbagTex")
+    if mat and _texture_matches(mat, img_path, alpha):
+        mapping_node = _node_of_type(mat, "MAPPING")
+        if mapping_node is not None:
+            mapping_node.inputs["Scale"].default_value = (tile, tile, tile)
+            return mat
+
     # まず基本のテクスチャノードツリーを作成
     mat = create_texture_material("SandbagTex", img_path, alpha)
     nt = mat.node_tree
 
     # Image Texture ノードを探す
-    tex_node = next(n for n in nt.nodes if n.type == "TEX_IMAGE")
-
-    # テクスチャ座標ノード＋マッピングノードを追加
-    coord_node = nt.nodes.new(type="ShaderNodeTexCoord")
-    mapping_node = nt.nodes.new(type="ShaderNodeMapping")
+    tex_node = _node_of_type(mat, "TEX_IMAGE")
+
+    # テクスチャ座標ノード＋マッピングノードを追加（既にあれば再利用）
+    mapping_node = _node_of_type(mat, "MAPPING")
+    if mapping_node is None:
+        coord_node = nt.nodes.new(type="ShaderNodeTexCoord")
+        mapping_node = nt.nodes.new(type="ShaderNodeMapping")
+
+        # ノードを接続
+        links = nt.links
+        # UV 座標 → マッピング → イメージテクスチャ
+        links.new(coord_node.outputs["UV"], mapping_node.inputs["Vector"])
+        links.new(mapping_node.outputs["Vector"], tex_node.inputs["Vector"])
     # 繰り返し回数を設定
     mapping_node.inputs["Scale"].default_value = (tile, tile, tile)
 
-    # ノードを接続
-    links = nt.links
-    # UV 座標 → マッピング → イメージテクスチャ
-    links.new(coord_node.outputs["UV"], mapping_node.inputs["Vector"])
-    links.new(mapping_node.outputs["Vector"], tex_node.inputs["Vector"])
-
-    log.debug(f"Sandbag texture material created with tile={tile}")
+    log.debug("Sandbag texture material created with tile=%s", tile)
     return mat
 
+@_cached
 def create_ground_material(
     name: str = GROUND_MAT_NAME, color: tuple = GROUND_MAT_COLOR
 ) -> bpy.types.Material:
-    """地面用シンプルマテリアル"""
+    """地面用シンプルマテリアル（構築済みなら色のみ合わせて再利用）"""
+    if mat := _existing(name):
+        bsdf = _node_of_type(mat, "BSDF_PRINCIPLED")
+        if bsdf is not None:
+            bsdf.inputs["Base Color"].default_value = color
+            return mat
     mat = bpy.data.materials.get(name) or bpy.data.materials.new(name)
     mat.use_nodes = True
     nt = mat.node_tree
@@ -10,14 +10,14 @@
 
 TODO:
 - キャップ付き / 開口付き梁のオプション追加
-- 回転ロジック共通化（ColumnBuilder と重複しているため）
 """
 
 import bpy
-from mathutils import Vector, Matrix
+from mathutils import Vector
 from typing import Dict, Set, Tuple
 from utils import setup_logging
 from builders.base import BuilderBase
+from .member_cylinders import build_member_cylinders
 
 log = setup_logging("BeamBuilder")
 
@@ -52,48 +52,14 @@ class BeamBuilder(BuilderBase):
         返り値:
             Dict[str, bpy.types.Object]: キー"{start}_{end}"→生成された Blender オブジェクト
         """
-        objs: Dict[str, bpy.types.Object] = {}
-        for start, end in self.edges:
-            try:
-                p0 = self.positions[start]
-                p1 = self.positions[end]
-            except KeyError as e:
-                log.error(
-                    f"BeamBuilder: ノード {e.args[0]} が positions に見つかりません。スキップします。"
-                )
-                continue
-
-            # 中点と方向、長さを計算
-            delta = p1 - p0
-            length = delta.length
-            mid = p0 + delta * 0.5
-
-            # 回転行列を作成（Z軸→delta方向）
-            up = Vector((0, 0, 1))
-            axis = up.cross(delta)
-            if axis.length < 1e-6:
-                rot_mat = Matrix.Identity(3)
-            else:
-                angle = up.angle(delta)
-                rot_mat = Matrix.Rotation(angle, 4, axis.normalized())
-
-            # 円柱を追加
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=self.thickness / 2,
-                depth=length,
-                location=mid,
-            )
-            obj = bpy.context.object
-            obj.name = f"{self.name_prefix}_{start}_{end}"
-
-            # 回転適用
-            obj.matrix_world @= rot_mat.to_4x4()
-
-            key = f"{start}_{end}"
-            objs[key] = obj
-            log.debug(
-                f"{obj.name} created between {start} and {end}, thickness={self.thickness}, length={length:.3f}"
-            )
-
+        # 生成処理は柱・梁で共通（共有円柱メッシュ・一括変換計算）
+        objs = build_member_cylinders(
+            self.positions,
+            self.edges,
+            self.thickness,
+            self.name_prefix,
+            "BeamBuilder",
+            log,
+        )
         log.info(f"{len(objs)} 件の梁オブジェクトを生成しました。")
         return objs
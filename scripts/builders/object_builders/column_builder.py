@@ -10,14 +10,14 @@
 
 TODO:
 - 柱のキャップ（上下）オプション追加
-- 位置合わせ／回転ロジックの共通化
 """
 
 import bpy
-from mathutils import Vector, Matrix
+from mathutils import Vector
 from typing import Dict, Set, Tuple
 from utils import setup_logging
 from builders.base import BuilderBase
+from .member_cylinders import build_member_cylinders
 
 log = setup_logging("ColumnBuilder")
 
@@ -43,57 +43,23 @@ class ColumnBuilder(BuilderBase):
         self.thickness = thickness
         self.name_prefix = name_prefix
 
-    def build(self) -> Dict[int, bpy.types.Object]:
+    def build(self) -> Dict[str, bpy.types.Object]:
         """
         役割:
             各エッジをつなぐ円柱を生成し、ID 辞書で返却する。
             辺ごとに一意なキーを作るため “start_end” 形式の文字列をキーに使用。
 
         返り値:
-            Dict[int, bpy.types.Object]: キー “{start}_{end}”→生成された Blender オブジェクト
+            Dict[str, bpy.types.Object]: キー “{start}_{end}”→生成された Blender オブジェクト
         """
-        objs: Dict[int, bpy.types.Object] = {}
-        for start, end in self.edges:
-            try:
-                p0 = self.positions[start]
-                p1 = self.positions[end]
-            except KeyError as e:
-                log.error(
-                    f"ColumnBuilder: ノード {e.args[0]} が positions に見つかりません。スキップします。"
-                )
-                continue
-
-            # 中点と方向、長さを計算
-            delta = p1 - p0
-            length = delta.length
-            mid = p0 + delta * 0.5
-
-            # Blender での円柱はデフォルト Z 軸方向なので、向きを合わせるマトリックスを作成
-            up = Vector((0, 0, 1))
-            axis = up.cross(delta)
-            if axis.length < 1e-6:
-                rot_mat = Matrix.Identity(3)
-            else:
-                angle = up.angle(delta)
-                rot_mat = Matrix.Rotation(angle, 4, axis.normalized())
-
-            # 円柱を追加
-            bpy.ops.mesh.primitive_cylinder_add(
-                radius=self.thickness / 2,
-                depth=length,
-                location=mid,
-            )
-            obj = bpy.context.object
-            obj.name = f"{self.name_prefix}_{start}_{end}"
-
-            # 回転適用
-            obj.matrix_world @= rot_mat.to_4x4()
-
-            objs_key = f"{start}_{end}"
-            objs[objs_key] = obj
-            log.debug(
-                f"{obj.name} created between {start} and {end}, thickness={self.thickness}, length={length:.3f}"
-            )
-
+        # 生成処理は柱・梁で共通（共有円柱メッシュ・一括変換計算）
+        objs = build_member_cylinders(
+            self.positions,
+            self.edges,
+            self.thickness,
+            self.name_prefix,
+            "ColumnBuilder",
+            log,
+        )
         log.info(f"{len(objs)} 件の柱オブジェクトを生成しました。")
         return objs
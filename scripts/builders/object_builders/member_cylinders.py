@@ -0,0 +1,90 @@
+# builders/object_builders/member_cylinders.py
+
+"""
+ファイル名: builders/object_builders/member_cylinders.py
+
+責務:
+- 柱・梁に共通する「エッジ集合 → 2点間の円柱オブジェクト群」の生成処理を提供する。
+- ColumnBuilder / BeamBuilder はプレフィクスとログ出力元のみ指定して本関数を呼ぶ。
+"""
+
+import bpy
+import logging
+import numpy as np
+from mathutils import Vector
+from typing import Dict, Iterable, List, Tuple
+from .primitive_meshes import unit_cylinder_mesh, cylinder_transforms
+
+
+def build_member_cylinders(
+    positions: Dict[int, Vector],
+    edges: Iterable[Tuple[int, int]],
+    thickness: float,
+    name_prefix: str,
+    owner: str,
+    log: logging.Logger,
+) -> Dict[str, bpy.types.Object]:
+    """
+    役割:
+        各エッジの両端ノードを結ぶ円柱オブジェクトを生成し、シーンに配置する。
+        円柱メッシュは全部材で共有し、長さは scale.z で与える（orig_depth=1 としてアニメ側と整合）。
+
+    引数:
+        positions: ノードID→座標 Vector の辞書
+        edges: (start_id, end_id) の集合
+        thickness: 円柱の直径（Blender 単位）
+        name_prefix: 作成オブジェクト名（"{name_prefix}_{start}_{end}"）・メッシュ名のプレフィクス
+        owner: ログメッセージに付けるビルダー名
+        log: 呼び出し元ビルダーのロガー
+
+    返り値:
+        Dict[str, bpy.types.Object]: キー "{start}_{end}"→生成された Blender オブジェクト
+    """
+    mesh = unit_cylinder_mesh(f"{name_prefix}Mesh", thickness / 2)
+    # ループ内で bpy.context / bpy.data の属性をたどらないよう、呼び出し先を先に束縛
+    new_object = bpy.data.objects.new
+    link = bpy.context.collection.objects.link
+
+    # 端点の揃った部材だけを集め、中点・回転・長さは全部材まとめて計算する
+    valid: List[Tuple[int, int]] = []
+    for start, end in edges:
+        # 例外を使わず事前に判定してスキップする
+        if start not in positions or end not in positions:
+            missing = start if start not in positions else end
+            log.error(
+                "%s: ノード %s が positions に見つかりません。スキップします。",
+                owner,
+                missing,
+            )
+            continue
+        valid.append((start, end))
+    p0s = np.array([positions[a] for a, _ in valid], dtype=np.float64).reshape(-1, 3)
+    p1s = np.array([positions[b] for _, b in valid], dtype=np.float64).reshape(-1, 3)
+    mids, quats, lengths = cylinder_transforms(p0s, p1s)
+
+    objs: Dict[str, bpy.types.Object] = {}
+    for (start, end), mid, quat, length in zip(valid, mids, quats, lengths):
+        # 長さ0の縮退部材はオブジェクトを作らない
+        if length <= 1e-9:
+            log.warning("%s: %s-%s の長さが0のためスキップします。", owner, start, end)
+            continue
+        # 円柱オブジェクトを追加（オペレータを使わず共有メッシュを参照）
+        key = f"{start}_{end}"
+        obj = new_object(f"{name_prefix}_{key}", mesh)
+        link(obj)
+        obj.location = mid
+        obj.rotation_mode = "QUATERNION"
+        obj.rotation_quaternion = quat
+        obj.scale = (1.0, 1.0, length)
+        obj["orig_depth"] = 1.0
+
+        objs[key] = obj
+        log.debug(
+            "%s created between %s and %s, thickness=%s, length=%.3f",
+            obj.name,
+            start,
+            end,
+            thickness,
+            length,
+        )
+    return objs
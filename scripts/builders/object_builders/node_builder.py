@@ -16,6 +16,7 @@ from typing import Dict
 from utils import setup_logging
 from cores.entities import Node
 from builders.base import BuilderBase
+from .primitive_meshes import uv_sphere_mesh
 
 log = setup_logging("NodeBuilder")
 
@@ -35,6 +36,11 @@ class NodeBuilder(BuilderBase):
         返り値:
             Dict[int, bpy.types.Object]: ノードID→Blenderオブジェクト
         """
+        # 球メッシュは全ノードで共有し、オブジェクトのみノードごとに作成
+        mesh = uv_sphere_mesh("NodeMesh", self.radius)
+        # ループ内で bpy.context / bpy.data の属性をたどらないよう、呼び出し先を先に束縛
+        new_object = bpy.data.objects.new
+        link = bpy.context.collection.objects.link
         objs: Dict[int, bpy.types.Object] = {}
         for nid, node in self.nodes.items():
             # Node 型チェック
@@ -55,11 +61,11 @@ class NodeBuilder(BuilderBase):
 
             # 球体生成
             try:
-                bpy.ops.mesh.primitive_uv_sphere_add(radius=self.radius, location=pos)
-                obj = bpy.context.object
-                obj.name = f"Node_{nid}"
+                obj = new_object(f"Node_{nid}", mesh)
+                link(obj)
+                obj.location = pos
                 objs[nid] = obj
-                log.debug(f"Node_{nid} created at {tuple(pos)}")
+                log.debug("Node_%s created at %s", nid, pos)
             except Exception as e:
                 log.error(f"NodeBuilder: Node_{nid} の生成失敗: {e}")
 
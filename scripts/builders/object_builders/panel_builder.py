@@ -6,17 +6,20 @@
 責務:
 - コア Panel リストから Blender 壁パネルオブジェクトを生成する。
 - 頂点数が 4 以外のパネルはスキップし、生成失敗時はログに記録のみ行う。
+- 各パネルメッシュには生成時に UV レイヤ（UV_MAP_NAME）を一度だけ作成する。
+- PANEL_MERGE 有効時は全パネルを1メッシュ（四角形面の集合）として1オブジェクトに生成する。
 - アニメーション・マテリアル処理は含まない。
 
 TODO:
 - 不正形状パネルや多角形対応
-- UV／マテリアル適用ロジックの分離
+- マテリアル適用ロジックの分離
 """
 
 import bpy
 from typing import List, Any
 from utils import setup_logging
 from builders.base import BuilderBase
+from configs import PANEL_MERGE, PANEL_MERGED_SUFFIX, UV_MAP_NAME, QUAD_UVS
 
 log = setup_logging("PanelBuilder")
 
@@ -45,8 +48,15 @@ class PanelBuilder(BuilderBase):
             self.log.warning("PanelBuilder: パネルデータが空です。スキップします。")
             return []
 
+        if PANEL_MERGE:
+            return self._build_merged()
+
         blender_objs: List[bpy.types.Object] = []
         self.log.info("===== パネル生成開始 =====")
+        # ループ内で bpy.context / bpy.data の属性をたどらないよう、呼び出し先を先に束縛
+        new_mesh = bpy.data.meshes.new
+        new_object = bpy.data.objects.new
+        link = bpy.context.collection.objects.link
         for panel in self.panels:
             try:
                 # ノードから頂点座標を抽出
@@ -58,26 +68,98 @@ class PanelBuilder(BuilderBase):
                     continue
 
                 # メッシュ／オブジェクト作成
-                mesh = bpy.data.meshes.new(f"{self.name_prefix}_{panel.id}")
-                obj = bpy.data.objects.new(f"{self.name_prefix}_{panel.id}", mesh)
-                bpy.context.collection.objects.link(obj)
+                name = f"{self.name_prefix}_{panel.id}"
+                mesh = new_mesh(name)
+                obj = new_object(name, mesh)
+                link(obj)
 
                 # Blender 用座標リストと面情報
                 verts_bl = [tuple(v) for v in verts]
                 faces = [(0, 1, 2, 3)]
                 mesh.from_pydata(verts_bl, [], faces)
+                # UVレイヤは生成時に一度だけ作成（アニメーション側では作り直さない）
+                mesh.uv_layers.new(name=UV_MAP_NAME).data.foreach_set("uv", QUAD_UVS)
                 mesh.update()
 
                 # メタデータとしてパネル ID・種別・階数を格納
+                # （統合メッシュ時は面ごとのリスト panel_kinds / panel_floors に対応）
                 obj["panel_ids"] = [n.id for n in panel.nodes]
                 obj["panel_kind"] = panel.kind
-                if hasattr(panel, "floor"):
-                    obj["panel_floor"] = panel.floor
+                floor = getattr(panel, "floor", None)
+                if floor is not None:
+                    obj["panel_floor"] = floor
 
                 blender_objs.append(obj)
-                self.log.debug(f"{self.name_prefix}_{panel.id} を生成しました。")
+                self.log.debug("%s_%s を生成しました。", self.name_prefix, panel.id)
             except Exception as e:
                 self.log.error(f"PanelBuilder: Panel {panel.id} 生成失敗: {e}")
 
         self.log.info(f"{len(blender_objs)} 件のパネルオブジェクトを生成しました。")
         return blender_objs
+
+    def _build_merged(self) -> List[bpy.types.Object]:
+        """
+        役割:
+            全パネルを1メッシュに統合し、1オブジェクト（{name_prefix}_Merged）として生成する。
+            不正なパネルは個別パネル生成時と同様にログを残してスキップする。
+            panel_ids にはパネル順に4ノードずつ連結したIDを格納する（面 i は頂点 4i〜4i+3）。
+            panel_kinds / panel_floors には面 i のパネルの種別・階数を格納する
+            （個別生成時の panel_kind / panel_floor に対応。階数なしは空文字）。
+
+        返り値:
+            List[bpy.types.Object]: 統合パネルオブジェクト1件のリスト（有効パネル無しは空）
+        """
+        self.log.info("===== パネル生成開始（統合メッシュ） =====")
+        verts_bl = []
+        panel_ids: List[int] = []
+        panel_kinds: List[str] = []
+        panel_floors: List[str] = []
+        for panel in self.panels:
+            try:
+                nodes = panel.nodes
+                if len(nodes) != 4:
+                    self.log.warning(
+                        f"Panel {panel.id}: 4ノード以外は生成不可 (nodes={len(nodes)})"
+                    )
+                    continue
+                # 途中で失敗したパネルの頂点が混ざらないよう、揃ってから追加する
+                verts = [tuple(n.pos) for n in nodes]
+                ids = [n.id for n in nodes]
+                kind = panel.kind
+                floor = getattr(panel, "floor", None)
+                floor = "" if floor is None else str(floor)
+            except Exception as e:
+                self.log.error(f"PanelBuilder: Panel {panel.id} 生成失敗: {e}")
+                continue
+            verts_bl.extend(verts)
+            panel_ids.extend(ids)
+            panel_kinds.append(kind)
+            panel_floors.append(floor)
+            self.log.debug("%s_%s を統合メッシュに追加しました。", self.name_prefix, panel.id)
+
+        n_faces = len(panel_kinds)
+        if not n_faces:
+            self.log.warning("PanelBuilder: 生成可能なパネルがありません。")
+            return []
+
+        name = f"{self.name_prefix}_{PANEL_MERGED_SUFFIX}"
+        try:
+            mesh = bpy.data.meshes.new(name)
+            obj = bpy.data.objects.new(name, mesh)
+            bpy.context.collection.objects.link(obj)
+            faces = [tuple(range(4 * i, 4 * i + 4)) for i in range(n_faces)]
+            mesh.from_pydata(verts_bl, [], faces)
+            mesh.uv_layers.new(name=UV_MAP_NAME).data.foreach_set(
+                "uv", QUAD_UVS * n_faces
+            )
+            mesh.update()
+
+            obj["panel_ids"] = panel_ids
+            obj["panel_kinds"] = panel_kinds
+            obj["panel_floors"] = panel_floors
+        except Exception as e:
+            self.log.error(f"PanelBuilder: 統合パネル {name} 生成失敗: {e}")
+            return []
+
+        self.log.info(f"{n_faces} 件のパネルを1オブジェクトに統合して生成しました。")
+        return [obj]
@@ -0,0 +1,184 @@
+# builders/object_builders/primitive_meshes.py
+
+"""
+ファイル名: builders/object_builders/primitive_meshes.py
+
+責務:
+- 複数オブジェクトで共有する基本形状メッシュ（Mesh データブロック）を bpy.data から直接生成する。
+- 共有円柱を2点間に配置するための変換（中点・回転・長さ）を全部材まとめて計算する。
+- bpy.ops.mesh.primitive_*_add はオペレータ実行ごとにコンテキスト切替・シーン更新が走るため、
+  大量生成するビルダーは本モジュールのメッシュを共有してオブジェクトのみ作成する。
+- オペレータ版と同様に UV マップ（UV_MAP_NAME）を生成する。
+"""
+
+import bpy
+import math
+import numpy as np
+from typing import List, Tuple
+from configs import UV_MAP_NAME
+
+
+def _new_mesh(
+    name: str,
+    verts: List[Tuple[float, float, float]],
+    faces: List[Tuple[int, ...]],
+    uvs: List[float],
+) -> bpy.types.Mesh:
+    """
+    役割:
+        頂点・面からメッシュを生成し、面ループ順の UV 座標（平坦リスト）を UV マップに書き込む。
+    """
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.uv_layers.new(name=UV_MAP_NAME).data.foreach_set("uv", uvs)
+    mesh.update()
+    return mesh
+
+
+def unit_cylinder_mesh(name: str, radius: float, vertices: int = 32) -> bpy.types.Mesh:
+    """
+    役割:
+        原点中心・Z 軸方向・長さ 1 の円柱メッシュを生成する（上下は N角形で閉じる）。
+        部材長はオブジェクトの scale.z で与える。
+        UV は primitive_cylinder_add と同じ配置（側面を上半分に帯状、下面・上面を下半分に円形）。
+
+    引数:
+        name: 生成するメッシュ名
+        radius: 円柱の半径
+        vertices: 円周の分割数（primitive_cylinder_add の既定値と同じ 32）
+
+    返り値:
+        bpy.types.Mesh: 生成したメッシュ
+    """
+    step = 2.0 * math.pi / vertices
+    ring = [
+        (radius * math.cos(i * step), radius * math.sin(i * step))
+        for i in range(vertices)
+    ]
+    verts: List[Tuple[float, float, float]] = [(x, y, -0.5) for x, y in ring]
+    verts += [(x, y, 0.5) for x, y in ring]
+    faces: List[Tuple[int, ...]] = [
+        (i, (i + 1) % vertices, vertices + (i + 1) % vertices, vertices + i)
+        for i in range(vertices)
+    ]
+    faces.append(tuple(reversed(range(vertices))))
+    faces.append(tuple(range(vertices, 2 * vertices)))
+
+    uvs: List[float] = []
+    for i in range(vertices):
+        u0 = i / vertices
+        u1 = (i + 1) / vertices
+        uvs += (u0, 0.5, u1, 0.5, u1, 1.0, u0, 1.0)
+    # 下面は (0.25, 0.25)、上面は (0.75, 0.25) を中心とする半径 0.25 の円
+    for cu, order in ((0.25, reversed(range(vertices))), (0.75, range(vertices))):
+        for i in order:
+            uvs += (
+                cu + 0.25 * math.cos(i * step),
+                0.25 + 0.25 * math.sin(i * step),
+            )
+    return _new_mesh(name, verts, faces, uvs)
+
+
+def uv_sphere_mesh(
+    name: str, radius: float, segments: int = 32, ring_count: int = 16
+) -> bpy.types.Mesh:
+    """
+    役割:
+        原点中心の UV 球メッシュを生成する（極は三角形、それ以外は四角形）。
+        UV は経度を u、緯度を v とする正距円筒図法（継ぎ目は u=0/1 で分離）。
+
+    引数:
+        name: 生成するメッシュ名
+        radius: 球の半径
+        segments: 経度方向の分割数（primitive_uv_sphere_add の既定値と同じ 32）
+        ring_count: 緯度方向の分割数（同 16）
+
+    返り値:
+        bpy.types.Mesh: 生成したメッシュ
+    """
+    verts: List[Tuple[float, float, float]] = [(0.0, 0.0, radius)]
+    for r in range(1, ring_count):
+        phi = math.pi * r / ring_count
+        z = radius * math.cos(phi)
+        rho = radius * math.sin(phi)
+        for s in range(segments):
+            theta = 2.0 * math.pi * s / segments
+            verts.append((rho * math.cos(theta), rho * math.sin(theta), z))
+    bottom = len(verts)
+    verts.append((0.0, 0.0, -radius))
+
+    def ring_vert(r: int, s: int) -> int:
+        # r は 0 始まりの緯線番号（上から）、s は経度方向の番号
+        return 1 + r * segments + s % segments
+
+    def ring_v(r: int) -> float:
+        # 緯線番号 r（上から 0 始まり）の v 座標（北極 1、南極 0）
+        return 1.0 - (r + 1) / ring_count
+
+    faces: List[Tuple[int, ...]] = []
+    uvs: List[float] = []
+    for s in range(segments):
+        faces.append((0, ring_vert(0, s), ring_vert(0, s + 1)))
+        u0, u1 = s / segments, (s + 1) / segments
+        uvs += ((u0 + u1) * 0.5, 1.0, u0, ring_v(0), u1, ring_v(0))
+    for r in range(ring_count - 2):
+        for s in range(segments):
+            faces.append(
+                (
+                    ring_vert(r, s),
+                    ring_vert(r + 1, s),
+                    ring_vert(r + 1, s + 1),
+                    ring_vert(r, s + 1),
+                )
+            )
+            u0, u1 = s / segments, (s + 1) / segments
+            v0, v1 = ring_v(r), ring_v(r + 1)
+            uvs += (u0, v0, u0, v1, u1, v1, u1, v0)
+    last = ring_count - 2
+    for s in range(segments):
+        faces.append((bottom, ring_vert(last, s + 1), ring_vert(last, s)))
+        u0, u1 = s / segments, (s + 1) / segments
+        uvs += ((u0 + u1) * 0.5, 0.0, u1, ring_v(last), u0, ring_v(last))
+
+    return _new_mesh(name, verts, faces, uvs)
+
+
+def cylinder_transforms(
+    p0: np.ndarray, p1: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    役割:
+        Z 軸方向の単位円柱を p0→p1 に沿わせる変換を全部材まとめて計算する。
+
+    引数:
+        p0, p1: 両端座標（(M, 3)）
+
+    返り値:
+        (中点 (M, 3), 回転クォータニオン wxyz (M, 4), 長さ (M,))
+
+    注意:
+        - up=(0,0,1) 固定のため、回転軸は (-dy, dx, 0)、角度は acos(dz / length) に簡約
+        - 軸がほぼ 0（Z 軸と平行・長さ0）の部材は無回転
+    """
+    p0 = np.asarray(p0, dtype=np.float64).reshape(-1, 3)
+    p1 = np.asarray(p1, dtype=np.float64).reshape(-1, 3)
+    delta = p1 - p0
+    length = np.linalg.norm(delta, axis=1)
+    mid = p0 + delta * 0.5
+
+    ax = -delta[:, 1]
+    ay = delta[:, 0]
+    axis_len_sq = ax * ax + ay * ay
+    rotate = axis_len_sq >= 1e-12
+    cos = np.divide(delta[:, 2], length, out=np.ones_like(length), where=rotate)
+    half = 0.5 * np.arccos(np.clip(cos, -1.0, 1.0))
+    inv = np.divide(
+        1.0, np.sqrt(axis_len_sq), out=np.zeros_like(length), where=rotate
+    )
+    s = np.sin(half) * inv
+
+    quat = np.zeros((len(length), 4), dtype=np.float64)
+    quat[:, 0] = np.cos(half)
+    quat[:, 1] = ax * s
+    quat[:, 2] = ay * s
+    return mid, quat, length
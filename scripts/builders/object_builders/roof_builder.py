@@ -16,8 +16,9 @@ TODO:
 """
 
 import bpy
+import numpy as np
 from mathutils import Vector
-from typing import Dict, Tuple, List, Optional
+from typing import Dict, Tuple, List, Optional, Iterable
 from utils import setup_logging
 from builders.base import BuilderBase
 from configs import EPS_XY_MATCH
@@ -25,6 +26,20 @@ from configs import EPS_XY_MATCH
 log = setup_logging("RoofBuilder")
 
 
+def _grid_levels(values: Iterable[float]) -> Tuple[List[float], Dict[float, int]]:
+    """
+    座標値を EPS_XY_MATCH 以内で同一列とみなして昇順に並べ、
+    (列の代表値リスト, 座標値→列番号) を返す。
+    """
+    levels: List[float] = []
+    index_of: Dict[float, int] = {}
+    for v in sorted(set(values)):
+        if not levels or v - levels[-1] >= EPS_XY_MATCH:
+            levels.append(v)
+        index_of[v] = len(levels) - 1
+    return levels, index_of
+
+
 class RoofBuilder(BuilderBase):
     def __init__(self, nodes: Dict[int, Vector], name: str = "Roof"):
         """初期化: nodes は {node_id: Vector} 形式。"""
@@ -45,43 +60,35 @@ class RoofBuilder(BuilderBase):
             (RoofObject or None, List of quad tuples)
         """
         # 1) Zレベル抽出
-        zs = sorted({v.z for v in self.nodes.values()})
-        if not zs:
+        # 最上層の z だけが必要なため、全 z の集合・ソートは作らない
+        if not self.nodes:
             log.warning("RoofBuilder: No Z levels found")
             return None, []
-        top_z = zs[-1]
+        top_z = max(v.z for v in self.nodes.values())
         tops: Dict[int, Vector] = {
             nid: pos
             for nid, pos in self.nodes.items()
             if abs(pos.z - top_z) < EPS_XY_MATCH
         }
 
-        # 2) 格子状ノードをX/Yでソート
-        xs = sorted({v.x for v in tops.values()})
-        ys = sorted({v.y for v in tops.values()})
-
-        def fid(x: float, y: float) -> Optional[int]:
-            """座標(x,y)に最も近いノードIDを返す"""
-            return next(
-                (
-                    nid
-                    for nid, pos in tops.items()
-                    if abs(pos.x - x) < EPS_XY_MATCH and abs(pos.y - y) < EPS_XY_MATCH
-                ),
-                None,
-            )
+        # 2) 格子状ノードをX/Yでソートし、(X列, Y列)→ノードID の密な整数配列に並べる
+        xs, col_of = _grid_levels(v.x for v in tops.values())
+        ys, row_of = _grid_levels(v.y for v in tops.values())
+        grid = np.full((len(xs), len(ys)), -1, dtype=np.int64)
+        for nid, pos in tops.items():
+            i, j = col_of[pos.x], row_of[pos.y]
+            if grid[i, j] < 0:
+                grid[i, j] = nid
 
-        # クワッド探索
-        quads: List[Tuple[int, int, int, int]] = []
-        for i in range(len(xs) - 1):
-            for j in range(len(ys) - 1):
-                bl = fid(xs[i], ys[j])
-                br = fid(xs[i + 1], ys[j])
-                tr = fid(xs[i + 1], ys[j + 1])
-                tl = fid(xs[i], ys[j + 1])
-                if None not in (bl, br, tr, tl):
-                    quads.append((bl, br, tr, tl))
-                    log.debug(f"Roof quad: {bl}-{br}-{tr}-{tl}")
+        # クワッド探索（隣接4セルが全て埋まっている格子を一括抽出）
+        corners = np.stack(
+            (grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:]), axis=-1
+        ).reshape(-1, 4)
+        quads: List[Tuple[int, int, int, int]] = [
+            tuple(int(nid) for nid in quad) for quad in corners[(corners >= 0).all(axis=1)]
+        ]
+        for bl, br, tr, tl in quads:
+            log.debug("Roof quad: %s-%s-%s-%s", bl, br, tr, tl)
 
         # 3) Blenderオブジェクト生成
         try:
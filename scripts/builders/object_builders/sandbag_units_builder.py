@@ -46,6 +46,8 @@ class SandbagUnitsBuilder(BuilderBase):
                 if obj:
                     col.objects.link(obj)
             collections[uid] = col
-            self.log.debug(f"Unit_{uid} collection created with {len(sb_ids)} sandbags")
+            self.log.debug(
+                "Unit_%s collection created with %d sandbags", uid, len(sb_ids)
+            )
         self.log.info(f"{len(collections)} sandbag units built.")
         return collections
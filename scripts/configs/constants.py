@@ -40,11 +40,17 @@ NODE_OBJ_PREFIX = "Node_"
 PANEL_OBJ_PREFIX = "Panel_"
 MEMBER_OBJ_PREFIX = "Member_"
 COLUMN_OBJ_PREFIX = "Column_"
+BEAM_OBJ_PREFIX = "Beam_"
 LABEL_OBJ_PREFIX = "Label_"
 SANDBAG_OBJ_PREFIX = "Sandbag_"
 ROOF_OBJ_NAME = "Roof"
 ROOF_MESH_NAME = "RoofMesh"
+PANEL_MERGED_SUFFIX = "Merged"  # 統合パネルのオブジェクト名は "{name_prefix}_Merged"
 UV_MAP_NAME = "UVMap"
+QUAD_UVS = (0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0)  # 四角形1面分のループUV（頂点順 a, b, d, c）
+NODE_ANIM_COLLECTION_NAME = "AnimNodes"
+SANDBAG_ANIM_COLLECTION_NAME = "AnimSandbags"
+MEMBER_ANIM_COLLECTION_NAME = "AnimMembers"
 
 # ----------------------------
 # 構造物・幾何パラメータ
@@ -54,6 +60,7 @@ MEMBER_THICK = 0.4
 CYLINDER_VERTS = 4
 EPS_XY_MATCH = 1e-3
 EPS_AXIS = 1e-6
+EPS_MOVE = 1e-6  # フレーム間でこれ未満の移動は再描画を省略
 
 # 工字サンドバッグ表示用パラメータ
 SANDBAG_FACE_SIZE      = Vector((3.0, 3.0))  
@@ -82,6 +89,8 @@ ANIM_FPS = 32
 ANIM_SECONDS = 30
 ANIM_TOTAL_FRAMES = ANIM_FPS * ANIM_SECONDS
 DISP_SCALE = 10
+ANIM_DISP_QUANTIZE = True  # 変位テーブルを int16 量子化して保持
+PANEL_MERGE = False  # 全パネルを1メッシュ（1オブジェクト）に統合して生成・更新
 
 # ----------------------------
 # マテリアル・描画パラメータ
@@ -77,7 +77,7 @@ class CoreFactory:
         node_map: Dict[int, Node] = {}
         for nid, data in nodes_data.items():
             node_map[nid] = Node(nid, data.pos, kind_id=data.kind_id)
-            log.debug(f"Loaded Node {nid}: pos={data.pos}, kind_id={data.kind_id}")
+            log.debug("Loaded Node %s: pos=%s, kind_id=%s", nid, data.pos, data.kind_id)
         return node_map
 
     def _construct_core_edges(
@@ -12,7 +12,10 @@
 - find_atやsegs等の小関数で可読性重視
 """
 
-from typing import Dict, List, NamedTuple
+import math
+import numpy as np
+from itertools import product
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from parsers import NodeData, EdgeData
 from configs import EPS_XY_MATCH
 from utils import setup_logging
@@ -49,53 +52,74 @@ def make_panel_unit(
         log.warning("No wall nodes found for panel construction.")
         return panels
 
-    zs = sorted({float(n.pos.z) for _, n in wall_nodes})
+    # 座標は一度だけ (N, 3) 配列に取り出し、階・範囲・外周辺の抽出はすべてここから行う
+    coords = np.array(
+        [(n.pos.x, n.pos.y, n.pos.z) for _, n in wall_nodes], dtype=np.float64
+    )
+    zs = np.unique(coords[:, 2]).tolist()
     if len(zs) < 2:
         log.warning("Insufficient Z levels to build panels.")
         return panels
 
-    xs = [n.pos.x for _, n in wall_nodes]
-    ys = [n.pos.y for _, n in wall_nodes]
-    xmin, xmax = min(xs), max(xs)
-    ymin, ymax = min(ys), max(ys)
+    xmin, ymin = coords[:, :2].min(axis=0).tolist()
+    xmax, ymax = coords[:, :2].max(axis=0).tolist()
 
     def eq(a: float, b: float) -> bool:
         """座標比較の誤差吸収（EPS_XY_MATCHで比較）"""
         return abs(a - b) < EPS_XY_MATCH
 
+    by_z = np.argsort(coords[:, 2], kind="stable")
+    z_keys = coords[by_z, 2]
+
+    def at_level(z: float) -> np.ndarray:
+        """z と誤差 EPS_XY_MATCH 未満で一致する階のノード添字を wall_nodes 順で返す"""
+        lo = np.searchsorted(z_keys, z - EPS_XY_MATCH, side="right")
+        hi = np.searchsorted(z_keys, z + EPS_XY_MATCH, side="left")
+        return np.sort(by_z[lo:hi])
+
+    def side(idx: np.ndarray, axis: int, value: float, sort_axis: int):
+        """idx のうち axis 座標が value に一致するノードを sort_axis 座標順に返す"""
+        sel = idx[np.abs(coords[idx, axis] - value) < EPS_XY_MATCH]
+        sel = sel[np.argsort(coords[sel, sort_axis], kind="stable")]
+        return [wall_nodes[i] for i in sel]
+
+    # 一辺 EPS_XY_MATCH の格子で座標をハッシュ化（一致判定は隣接セルまで見れば漏れない）
+    def cell(v: float) -> int:
+        return math.floor(v / EPS_XY_MATCH)
+
+    grid: Dict[Tuple[int, int, int], List[Tuple[int, int, NodeData]]] = {}
+    cells = np.floor(coords / EPS_XY_MATCH).astype(np.int64).tolist()
+    for order, ((nid, n), key) in enumerate(zip(wall_nodes, cells)):
+        grid.setdefault(tuple(key), []).append((order, nid, n))
+
+    def find_at(x: float, y: float, zval: float) -> Optional[Tuple[int, NodeData]]:
+        """指定座標に一致するノード（誤差吸収）を探索（複数一致時は wall_nodes 順で先頭）"""
+        cx, cy, cz = cell(x), cell(y), cell(zval)
+        hits = [
+            (order, nid2, n2)
+            for dx, dy, dz in product((-1, 0, 1), repeat=3)
+            for order, nid2, n2 in grid.get((cx + dx, cy + dy, cz + dz), ())
+            if eq(n2.pos.z, zval) and eq(n2.pos.x, x) and eq(n2.pos.y, y)
+        ]
+        if not hits:
+            return None
+        _, nid2, n2 = min(hits, key=lambda hit: hit[0])
+        return nid2, n2
+
+    def segs(lst):
+        """隣接ノード間のペアを生成"""
+        return [(lst[i], lst[i + 1]) for i in range(len(lst) - 1)]
+
     # 各階ごとにpanel quad探索
     for lvl, z in enumerate(zs[:-1]):
         z_up = zs[lvl + 1]
-        left = sorted(
-            [(nid, n) for nid, n in wall_nodes if eq(n.pos.x, xmin) and eq(n.pos.z, z)],
-            key=lambda tup: tup[1].pos.y,
-        )
-        right = sorted(
-            [(nid, n) for nid, n in wall_nodes if eq(n.pos.x, xmax) and eq(n.pos.z, z)],
-            key=lambda tup: tup[1].pos.y,
-        )
-        front = sorted(
-            [(nid, n) for nid, n in wall_nodes if eq(n.pos.y, ymin) and eq(n.pos.z, z)],
-            key=lambda tup: tup[1].pos.x,
-        )
-        back = sorted(
-            [(nid, n) for nid, n in wall_nodes if eq(n.pos.y, ymax) and eq(n.pos.z, z)],
-            key=lambda tup: tup[1].pos.x,
-        )
-
-        def segs(lst):
-            """隣接ノード間のペアを生成"""
-            return [(lst[i], lst[i + 1]) for i in range(len(lst) - 1)]
+        level = at_level(z)
+        left = side(level, 0, xmin, 1)
+        right = side(level, 0, xmax, 1)
+        front = side(level, 1, ymin, 0)
+        back = side(level, 1, ymax, 0)
 
         for (a_id, a), (b_id, b) in segs(left) + segs(front) + segs(right) + segs(back):
-
-            def find_at(x: float, y: float, zval: float):
-                """指定座標に一致するノード（誤差吸収）を探索"""
-                for nid2, n2 in wall_nodes:
-                    if eq(n2.pos.z, zval) and eq(n2.pos.x, x) and eq(n2.pos.y, y):
-                        return nid2, n2
-                return None
-
             x1, y1 = a.pos.x, a.pos.y
             x2, y2 = b.pos.x, b.pos.y
             c = find_at(x1, y1, z_up)
@@ -141,7 +141,9 @@ def load_animation_data(path: str = NODE_ANIM_CSV) -> Dict[int, Dict[int, Vector
         frame = int(round(t_sec * ANIM_FPS))
         for j, (nid, comp_idx) in col_map.items():
             if j >= len(row):
-                log.debug(f"[{path}] [Line {lineno}] Missing column {j}, skipping")
+                log.debug(
+                    "[%s] [Line %d] Missing column %d, skipping", path, lineno, j
+                )
                 continue
             val_s = row[j].strip()
             if not val_s:
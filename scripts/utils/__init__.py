@@ -1,6 +1,6 @@
 # utils/__init__.py
 
-from .blender_scene_utils import clear_scene
+from .blender_scene_utils import clear_scene, register_frame_handler
 from .logging_utils import setup_logging
 from .main_utils import (
     parse_args,
@@ -15,6 +15,7 @@ from .main_utils import (
 
 __all__ = [
     "clear_scene",
+    "register_frame_handler",
     "setup_logging",
     "parse_args",
     "get_dataset_from_args",
@@ -1,16 +1,27 @@
 """
 Blenderシーン操作ユーティリティ
 - シーン上の全オブジェクト・データブロックを一括削除する関数を提供
+- 本スクリプトのフレーム更新ハンドラを重複なく登録する関数を提供
 - スクリプト自動実行時やテスト時に“状態初期化”として利用
 """
 
 import bpy
+from typing import Callable
+from configs import (
+    NODE_ANIM_COLLECTION_NAME,
+    SANDBAG_ANIM_COLLECTION_NAME,
+    MEMBER_ANIM_COLLECTION_NAME,
+)
+
+# 本スクリプトが登録したハンドラを識別するための属性名（値は種類ごとのキー）
+_HANDLER_ATTR = "_tbags_anim_handler"
 
 
 def clear_scene() -> None:
     """
     Blenderシーン内のすべてのオブジェクト・データブロックを削除する。
 
+    - アニメーション一括書き込み用コレクション（シーン未リンク）とその中のオブジェクトを削除
     - オブジェクト（mesh, curve, camera, light等）を全選択・削除
     - 未使用メッシュ/マテリアル/テクスチャ/画像データも全て削除しリセット
 
@@ -21,6 +32,19 @@ def clear_scene() -> None:
     例外:
         なし（Blender内部で削除できないデータはスキップ）
     """
+    # 一括書き込み用コレクションはシーンにリンクされないため object.delete では消えず、
+    # 参照されたオブジェクトが bpy.data に残って再実行時に ".001" 名が付くのを防ぐ
+    for name in (
+        NODE_ANIM_COLLECTION_NAME,
+        SANDBAG_ANIM_COLLECTION_NAME,
+        MEMBER_ANIM_COLLECTION_NAME,
+    ):
+        coll = bpy.data.collections.get(name)
+        if coll is None:
+            continue
+        for obj in list(coll.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.collections.remove(coll)
     bpy.ops.object.select_all(action="SELECT")
     bpy.ops.object.delete(use_global=False)
     for block in bpy.data.meshes:
@@ -31,3 +55,23 @@ def clear_scene() -> None:
         bpy.data.textures.remove(block, do_unlink=True)
     for block in bpy.data.images:
         bpy.data.images.remove(block, do_unlink=True)
+
+
+def register_frame_handler(handler: Callable, key: str) -> None:
+    """
+    frame_change_pre に本スクリプトのハンドラを登録する。
+
+    - 以前に本スクリプトが同じ key で登録したハンドラのみ取り除いてから追加する
+    - 再実行しても多重登録にならず、別 key の自ハンドラ・ユーザー・他アドオンのハンドラは残す
+
+    引数:
+        handler: 登録するハンドラ関数（scene を受け取る）
+        key: ハンドラの種類を表すキー（"ground" など）
+    戻り値:
+        なし（副作用として bpy.app.handlers.frame_change_pre を変更）
+    """
+    handlers = bpy.app.handlers.frame_change_pre
+    for h in [h for h in handlers if getattr(h, _HANDLER_ATTR, None) == key]:
+        handlers.remove(h)
+    setattr(handler, _HANDLER_ATTR, key)
+    handlers.append(handler)
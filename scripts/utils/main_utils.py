@@ -13,7 +13,7 @@ import bpy
 import argparse
 from typing import Tuple, Dict, List, Any, Optional
 
-from .blender_scene_utils import clear_scene
+from .blender_scene_utils import clear_scene, register_frame_handler
 from loaders import LoaderManager
 from cores.constructors.core_factory import CoreFactory
 from builders.scene_builders.scene_builder import SceneBuilder
@@ -22,7 +22,11 @@ from builders.hierarchy_builders.motion_parent_builder import (
     set_parent,
 )
 from builders.material_builders import apply_all_materials
-from animators import register_ground_anim_handler, on_frame_building
+from animators import (
+    make_ground_frame_updater,
+    update_building_frame,
+    BuildingAnimCache,
+)
 from loaders import load_earthquake_motion_csv
 from configs import (
     ANIM_FPS,
@@ -242,29 +246,32 @@ def setup_animation_handlers(
     }
     node_anim_data = {nid: v for nid, v in anim_data.items() if nid in base_node_pos}
 
-    # フレームチェンジハンドラをクリア＆再登録
-    bpy.app.handlers.frame_change_pre.clear()
-
-    # 地面アニメーションハンドラ
-    register_ground_anim_handler(
+    # 地面アニメーション（motion_parent の移動）
+    update_ground = make_ground_frame_updater(
         motion_parent=motion_parent,
         earthquake_anim_data=earthquake_anim_data,
     )
 
-    # 建物部材アニメーション
-    def _on_frame_building(scene):
-        on_frame_building(
-            scene,
-            panel_objs=panel_objs,
-            roof_obj=roof_obj,
-            roof_quads=roof_quads,
-            member_objs=member_objs,
-            node_objs=node_objs,
-            sandbag_objs=sandbag_objs,
-            anim_data=node_anim_data,
-            sandbag_anim_data=sandbag_anim_data,
-            base_node_pos=base_node_pos,
-            base_sandbag_pos=base_sandbag_pos,
-        )
+    # 建物部材アニメーション（トポロジ・参照は初期化時に一度だけ構築）
+    cache = BuildingAnimCache(
+        panel_objs=panel_objs,
+        roof_obj=roof_obj,
+        roof_quads=roof_quads,
+        member_objs=member_objs,
+        node_objs=node_objs,
+        sandbag_objs=sandbag_objs,
+        anim_data=node_anim_data,
+        sandbag_anim_data=sandbag_anim_data,
+        base_node_pos=base_node_pos,
+        base_sandbag_pos=base_sandbag_pos,
+    )
+
+    # 地面・建物を1つのハンドラで更新（フレーム番号の取得も1回）
+    # 参照はクロージャに束縛する（既定引数にすると Blender が depsgraph を渡す対象になるため）
+    def _on_frame(scene):
+        frame = scene.frame_current
+        update_ground(frame)
+        update_building_frame(frame, cache)
 
-    bpy.app.handlers.frame_change_pre.append(_on_frame_building)
+    # 前回実行時の同種ハンドラのみ置き換える（他のハンドラは消さない）
+    register_frame_handler(_on_frame, "building")